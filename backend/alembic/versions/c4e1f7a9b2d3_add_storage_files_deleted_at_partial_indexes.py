@@ -0,0 +1,48 @@
+"""add_storage_files_deleted_at_partial_indexes
+
+Revision ID: c4e1f7a9b2d3
+Revises: 05497957d66c
+Create Date: 2026-10-17 09:12:41.208315
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1f7a9b2d3'
+down_revision: Union[str, Sequence[str], None] = '05497957d66c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # storage_files is created from model metadata, so it may not exist yet
+    if not sa.inspect(op.get_bind()).has_table('storage_files'):
+        return
+
+    # Partial covering indexes let storage stats use index-only scans
+    op.create_index(
+        'ix_storage_files_active',
+        'storage_files',
+        ['deleted_at'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        postgresql_include=['file_size'],
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_storage_files_deleted',
+        'storage_files',
+        ['deleted_at'],
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+        postgresql_include=['file_size'],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_storage_files_deleted', table_name='storage_files', if_exists=True)
+    op.drop_index('ix_storage_files_active', table_name='storage_files', if_exists=True)
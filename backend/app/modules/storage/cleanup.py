@@ -5,21 +5,452 @@ This module provides functionality to clean up orphaned files and manage
 storage maintenance tasks.
 """
 import asyncio
+import hashlib
+import math
 import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 from app.core.config import get_settings
-from app.core.database import get_db_session
-from app.modules.storage.models import StorageFile
-from sqlalchemy import select, text
+from app.core.database import db_manager
+from app.modules.storage.models import FileStatus, StorageFile
+from sqlalchemy import and_, bindparam, delete, func, select, true, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from structlog import get_logger
 
 logger = get_logger(__name__)
-settings = get_settings()
+
+# Maximum number of paths bound into a single ``IN`` lookup
+PATH_LOOKUP_BATCH_SIZE = 10_000
+
+# Rows fetched per round-trip when streaming records for the orphan scan
+ORPHAN_SCAN_YIELD_PER = 1000
+
+# Maximum number of record ids soft-deleted by a single ``UPDATE``
+SOFT_DELETE_BATCH_SIZE = 1000
+
+# Soft-deleted files purged per batch, each batch with one DELETE and commit
+PURGE_BATCH_SIZE = 1000
+
+# Maximum number of unlink() calls in flight on the default thread pool
+UNLINK_CONCURRENCY = 64
+
+# Above this many files, orphan cleanup removes them with ``rm`` subprocesses
+BULK_UNLINK_THRESHOLD = 32
+
+# Paths passed to one ``rm`` invocation, keeping argv well under ARG_MAX
+BULK_UNLINK_GROUP_SIZE = 500
+
+# Rows fetched per round-trip when loading active paths into the Bloom filter
+ACTIVE_PATH_YIELD_PER = 10_000
+
+# Target false-positive rate of the active-path Bloom filter
+BLOOM_ERROR_RATE = 1e-4
+
+# Directories listed concurrently while scanning for orphaned files
+SCAN_WORKERS = 8
+
+# Failure line printed by ``rm`` under the C locale; only used to recover the reason
+RM_ERROR_PATTERN = re.compile(r"^rm: cannot remove '(?P<path>.+)': (?P<reason>.+)$")
+
+
+@dataclass(slots=True)
+class OrphanEntry:
+    """A file found on disk, with the size read while scanning it."""
+
+    path: str
+    size: int
+
+
+@dataclass(slots=True)
+class CleanupResult:
+    """Outcome of a ``run_cleanup_job`` run, serialized to a dict at the boundary."""
+
+    started_at: str
+    dry_run: bool
+    orphaned_files: dict = field(default_factory=dict)
+    orphaned_records: dict = field(default_factory=dict)
+    soft_deleted: dict = field(default_factory=dict)
+    storage_stats: dict = field(default_factory=dict)
+    completed_at: Optional[str] = None
+
+    @property
+    def files_cleaned(self) -> int:
+        """Files removed from disk across all phases."""
+        return self.orphaned_files.get("files_deleted", 0) + self.soft_deleted.get("files_deleted", 0)
+
+    @property
+    def records_cleaned(self) -> int:
+        """Database records removed or soft-deleted across all phases."""
+        return self.orphaned_records.get("records_deleted", 0) + self.soft_deleted.get("records_deleted", 0)
+
+    @property
+    def bytes_freed(self) -> int:
+        """Disk space reclaimed across all phases."""
+        return self.orphaned_files.get("bytes_freed", 0) + self.soft_deleted.get("bytes_freed", 0)
+
+
+class PathBloomFilter:
+    """
+    Fixed-size Bloom filter over relative file paths.
+
+    Memory stays at about 2.4 bytes per path for a 1e-4 false-positive rate,
+    where a set of the paths themselves would take hundreds of bytes each. A
+    miss means the path is definitely absent; a hit may be a false positive.
+    """
+
+    __slots__ = ("_bits", "_size", "_hash_count")
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of paths
+            error_rate: Target false-positive rate at ``capacity`` paths
+        """
+        capacity = max(capacity, 1)
+        self._size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, path: str) -> Iterator[int]:
+        """
+        Derive bit positions for a path by double hashing one digest.
+
+        Args:
+            path: Relative file path
+
+        Yields:
+            Bit positions
+        """
+        digest = hashlib.blake2b(path.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hash_count):
+            yield (first + i * second) % self._size
+
+    def add(self, path: str) -> None:
+        """
+        Add a path to the filter.
+
+        Args:
+            path: Relative file path
+        """
+        for position in self._positions(path):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, path: str) -> bool:
+        """Check whether a path may have been added."""
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(path))
+
+
+@lru_cache(maxsize=1)
+def _upload_path() -> Path:
+    """
+    Get the upload directory as a ``Path``, resolved from settings once.
+
+    Returns:
+        Root directory for locally stored files
+    """
+    return Path(get_settings().UPLOAD_DIR)
+
+
+def _scan_directory(path: str, cutoff: float) -> Tuple[List[str], List[OrphanEntry]]:
+    """
+    List one directory with ``os.scandir``.
+
+    Args:
+        path: Directory to list
+        cutoff: Only report files last modified before this timestamp
+
+    Returns:
+        Tuple of (subdirectory paths, old enough file entries). Symlinks are skipped.
+    """
+    subdirs: List[str] = []
+    files: List[OrphanEntry] = []
+    try:
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    try:
+                        file_stat = entry.stat()
+                        if file_stat.st_mtime < cutoff:
+                            files.append(OrphanEntry(entry.path, file_stat.st_size))
+                    except OSError:
+                        logger.warning("Could not get file stats", path=entry.path)
+    except OSError:
+        logger.warning("Could not scan directory", path=path)
+
+    return subdirs, files
+
+
+async def _parallel_scan(root: Path, cutoff: float, workers: int = SCAN_WORKERS) -> List[OrphanEntry]:
+    """
+    Walk a directory tree depth-first with a pool of worker coroutines.
+
+    Each worker takes a directory from a shared LIFO queue, lists it on a
+    thread and pushes the subdirectories back, so directory listing latency
+    overlaps across up to ``workers`` directories at once.
+
+    Args:
+        root: Root directory to walk
+        cutoff: Only report files last modified before this timestamp
+        workers: Number of directories listed concurrently
+
+    Returns:
+        Entries for matching regular files
+
+    Raises:
+        Exception: Re-raised from the first worker that fails; the others are cancelled
+    """
+    queue: asyncio.LifoQueue = asyncio.LifoQueue()
+    queue.put_nowait(os.fspath(root))
+    results: List[OrphanEntry] = []
+
+    async def worker() -> None:
+        while True:
+            directory = await queue.get()
+            try:
+                subdirs, files = await asyncio.to_thread(_scan_directory, directory, cutoff)
+                for subdir in subdirs:
+                    queue.put_nowait(subdir)
+                results.extend(files)
+            finally:
+                queue.task_done()
+
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    drained = asyncio.create_task(queue.join())
+    try:
+        # Workers only finish by raising, so the first one that does fails the
+        # scan instead of leaving its subtree (and maybe the queue) unwalked
+        done, _ = await asyncio.wait([drained, *tasks], return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task is not drained:
+                task.result()
+    finally:
+        for task in (drained, *tasks):
+            task.cancel()
+        await asyncio.gather(drained, *tasks, return_exceptions=True)
+
+    return results
+
+
+async def _snapshot_disk_paths(root: Path) -> FrozenSet[str]:
+    """
+    Collect every regular file under a directory in a single walk.
+
+    Args:
+        root: Root directory to walk
+
+    Returns:
+        File paths relative to ``root``
+    """
+    prefix_length = len(os.fspath(root)) + len(os.sep)
+    return frozenset(
+        entry.path[prefix_length:] for entry in await _parallel_scan(root, math.inf)
+    )
+
+
+def _remove_file(path: Union[str, Path]) -> None:
+    """
+    Remove a file, treating one that is already gone as removed.
+
+    Args:
+        path: File to remove
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+async def _unlink_concurrently(paths: List[Union[str, Path]]) -> list:
+    """
+    Unlink files on worker threads, ``UNLINK_CONCURRENCY`` at a time.
+
+    Args:
+        paths: Files to remove
+
+    Returns:
+        One entry per path: the exception raised while removing it, or
+        ``None`` on success
+    """
+    outcomes = []
+    for start in range(0, len(paths), UNLINK_CONCURRENCY):
+        batch = paths[start:start + UNLINK_CONCURRENCY]
+        outcomes.extend(
+            await asyncio.gather(
+                *(asyncio.to_thread(_remove_file, path) for path in batch),
+                return_exceptions=True
+            )
+        )
+    return outcomes
+
+
+async def _bulk_unlink(paths: List[Union[str, Path]]) -> Dict[str, str]:
+    """
+    Remove files with ``rm -f`` subprocesses, ``BULK_UNLINK_GROUP_SIZE`` paths each.
+
+    Args:
+        paths: Files to remove
+
+    Returns:
+        Mapping of path to failure reason for every file ``rm`` could not remove
+    """
+    failures: Dict[str, str] = {}
+    for start in range(0, len(paths), BULK_UNLINK_GROUP_SIZE):
+        group = [os.fspath(path) for path in paths[start:start + BULK_UNLINK_GROUP_SIZE]]
+        proc = await asyncio.create_subprocess_exec(
+            "rm", "-f", "--", *group,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, "LC_ALL": "C"}
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode == 0:
+            continue
+
+        # The file system, not stderr, decides which paths failed
+        reasons: Dict[str, str] = {}
+        for line in stderr.decode(errors="replace").splitlines():
+            match = RM_ERROR_PATTERN.match(line)
+            if match:
+                reasons[match.group("path")] = match.group("reason")
+            elif line:
+                logger.warning("Unexpected rm output", line=line)
+
+        for path in await asyncio.to_thread(_existing_paths, group):
+            failures[path] = reasons.get(path, f"rm exited with status {proc.returncode}")
+
+    return failures
+
+
+def _existing_paths(paths: List[str]) -> List[str]:
+    """Return the paths that still exist, without following symlinks."""
+    return [path for path in paths if os.path.lexists(path)]
+
+
+async def _load_active_path_filter(db: AsyncSession) -> PathBloomFilter:
+    """
+    Load the file paths of every active storage record into a Bloom filter.
+
+    Paths are streamed in batches of ``ACTIVE_PATH_YIELD_PER``, so memory use is
+    bounded by the filter and one batch rather than every path in the table.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Filter over paths, relative to the upload directory, of records that
+        are not soft-deleted
+    """
+    active_filter = PathBloomFilter(await db.scalar(_COUNT_ACTIVE_FILES) or 0)
+    async for file_path in await db.stream_scalars(_SELECT_ACTIVE_PATHS):
+        active_filter.add(file_path)
+    return active_filter
+
+
+# Statements are built once at import. Values travel as bound parameters, so
+# each statement keeps a stable cache key and SQLAlchemy reuses its compiled
+# SQL on every cleanup run.
+_IS_ACTIVE = StorageFile.deleted_at.is_(None)
+_IS_EXPIRED = and_(StorageFile.deleted_at.is_not(None), StorageFile.deleted_at < bindparam("cutoff"))
+
+_COUNT_ACTIVE_FILES = select(func.count()).select_from(StorageFile).where(_IS_ACTIVE)
+
+_SELECT_ACTIVE_PATHS = (
+    select(StorageFile.file_path)
+    .where(_IS_ACTIVE)
+    .execution_options(yield_per=ACTIVE_PATH_YIELD_PER)
+)
+
+_SELECT_TRACKED_PATHS = select(StorageFile.file_path).where(
+    _IS_ACTIVE,
+    StorageFile.file_path.in_(bindparam("paths", expanding=True))
+)
+
+_SELECT_ACTIVE_FILES_BEFORE = (
+    select(StorageFile)
+    .where(_IS_ACTIVE, StorageFile.created_at < bindparam("cutoff"))
+    .execution_options(yield_per=ORPHAN_SCAN_YIELD_PER)
+)
+
+# Sorts before every file id, so keyset paging from it starts at the first page
+_FIRST_PAGE_AFTER = UUID(int=0)
+
+_SELECT_EXPIRED_PAGE = (
+    select(StorageFile.id, StorageFile.file_path)
+    .where(_IS_EXPIRED, StorageFile.id > bindparam("after"))
+    .order_by(StorageFile.id)
+    .limit(PURGE_BATCH_SIZE)
+)
+
+_SOFT_DELETE_FILES = (
+    update(StorageFile)
+    .where(StorageFile.id.in_(bindparam("ids", expanding=True)))
+    .values(deleted_at=func.now(), status=FileStatus.DELETED)
+    .execution_options(synchronize_session=False)
+)
+
+_PURGE_FILES = (
+    delete(StorageFile)
+    .where(StorageFile.id.in_(bindparam("ids", expanding=True)))
+    .execution_options(synchronize_session=False)
+)
+
+# One aggregate per partial deleted_at index, each filtered on that index's
+# predicate and reading only deleted_at and the included file_size, so both
+# can be served by index-only scans
+_ACTIVE_TOTALS = (
+    select(func.count().label("files"), func.coalesce(func.sum(StorageFile.file_size), 0).label("size"))
+    .where(_IS_ACTIVE)
+    .subquery("active_totals")
+)
+_DELETED_TOTALS = (
+    select(func.count().label("files"), func.coalesce(func.sum(StorageFile.file_size), 0).label("size"))
+    .where(StorageFile.deleted_at.is_not(None))
+    .subquery("deleted_totals")
+)
+
+_STORAGE_STATS_COLUMNS = (
+    (_ACTIVE_TOTALS.c.files + _DELETED_TOTALS.c.files).label("total_files"),
+    _ACTIVE_TOTALS.c.files.label("active_files"),
+    _DELETED_TOTALS.c.files.label("deleted_files"),
+    _ACTIVE_TOTALS.c.size.label("active_size"),
+    (_ACTIVE_TOTALS.c.size + _DELETED_TOTALS.c.size).label("total_size"),
+)
+
+# Both totals are single rows, so joining them yields the one stats row
+_STORAGE_STATS_FROM = _ACTIVE_TOTALS.join(_DELETED_TOTALS, true())
+
+_SELECT_STORAGE_STATS = select(*_STORAGE_STATS_COLUMNS).select_from(_STORAGE_STATS_FROM)
+
+_FIRST_EXPIRED_PAGE = (
+    select(StorageFile.id, StorageFile.file_path)
+    .where(_IS_EXPIRED)
+    .order_by(StorageFile.id)
+    .limit(PURGE_BATCH_SIZE)
+    .subquery()
+)
+
+# Both arrays are ordered by id so they zip back into (id, file_path) pairs
+_SELECT_STORAGE_STATS_AND_EXPIRED = select(
+    *_STORAGE_STATS_COLUMNS,
+    select(func.array_agg(aggregate_order_by(_FIRST_EXPIRED_PAGE.c.id, _FIRST_EXPIRED_PAGE.c.id)))
+    .scalar_subquery().label("expired_ids"),
+    select(func.array_agg(aggregate_order_by(_FIRST_EXPIRED_PAGE.c.file_path, _FIRST_EXPIRED_PAGE.c.id)))
+    .scalar_subquery().label("expired_paths"),
+).select_from(_STORAGE_STATS_FROM)
 
 
 class StorageCleanupService:
@@ -33,97 +464,109 @@ class StorageCleanupService:
             db: Database session
         """
         self.db = db
-        self.storage_path = Path(settings.UPLOAD_DIR)
+        self.storage_path = _upload_path()
 
-    async def find_orphaned_files(self, older_than_hours: int = 24) -> List[Path]:
+    async def find_orphaned_files(
+        self,
+        older_than_hours: int = 24,
+        active_paths: Optional[PathBloomFilter] = None
+    ) -> List[OrphanEntry]:
         """
         Find files on disk that don't have corresponding database records.
 
         Args:
             older_than_hours: Only consider files older than this many hours
+            active_paths: Filter over active record paths from
+                ``_load_active_path_filter``; candidates it rules out are
+                orphaned without a lookup. When omitted, every candidate is
+                looked up
 
         Returns:
-            List of orphaned file paths
+            Orphaned files, with sizes taken from the scan
         """
-        orphaned_files = []
-        cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
+        # Epoch seconds, compared directly against st_mtime during the scan
+        cutoff = time.time() - older_than_hours * 3600
 
         if not self.storage_path.exists():
             logger.warning("Storage path does not exist", path=str(self.storage_path))
-            return orphaned_files
+            return []
 
-        # Get all file paths from database
-        result = await self.db.execute(
-            select(StorageFile.file_path).where(StorageFile.deleted_at.is_(None))
-        )
-        db_file_paths = {row[0] for row in result.fetchall()}
-
-        # Walk through storage directory
-        for file_path in self.storage_path.rglob("*"):
-            if file_path.is_file():
-                # Check if file is older than cutoff
-                try:
-                    file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_mtime > cutoff_time:
-                        continue
-                except OSError:
-                    logger.warning("Could not get file stats", path=str(file_path))
-                    continue
-
-                # Convert to relative path for comparison
-                try:
-                    relative_path = file_path.relative_to(self.storage_path)
-                    if str(relative_path) not in db_file_paths:
-                        orphaned_files.append(file_path)
-                except ValueError:
-                    # File is not within storage path
-                    continue
+        # Collect candidate files on disk, keyed by path relative to storage root
+        prefix_length = len(os.fspath(self.storage_path)) + len(os.sep)
+        candidates: Dict[str, OrphanEntry] = {
+            entry.path[prefix_length:]: entry
+            for entry in await _parallel_scan(self.storage_path, cutoff)
+        }
+
+        # Filter misses are definitely orphaned; only possible hits are confirmed
+        if active_paths is None:
+            relative_paths = list(candidates)
+        else:
+            relative_paths = [path for path in candidates if path in active_paths]
+
+        # Look up the remaining paths, chunked to stay under bind parameter limits
+        tracked_paths = set()
+        for start in range(0, len(relative_paths), PATH_LOOKUP_BATCH_SIZE):
+            result = await self.db.execute(
+                _SELECT_TRACKED_PATHS, {"paths": relative_paths[start:start + PATH_LOOKUP_BATCH_SIZE]}
+            )
+            tracked_paths.update(row[0] for row in result.fetchall())
+
+        orphaned_files = [
+            entry for relative_path, entry in candidates.items()
+            if relative_path not in tracked_paths
+        ]
 
         logger.info("Found orphaned files", count=len(orphaned_files))
         return orphaned_files
 
-    async def find_orphaned_database_records(self, older_than_hours: int = 24) -> List[StorageFile]:
+    async def find_orphaned_database_records(self, older_than_hours: int = 24) -> AsyncIterator[StorageFile]:
         """
         Find database records that don't have corresponding files on disk.
 
+        Rows are streamed in batches of ``ORPHAN_SCAN_YIELD_PER`` so memory use is
+        bounded by one batch rather than the whole table.
+
         Args:
             older_than_hours: Only consider records older than this many hours
 
-        Returns:
-            List of orphaned database records
+        Yields:
+            Orphaned database records
         """
         cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
 
-        # Get all non-deleted files from database
-        result = await self.db.execute(
-            select(StorageFile)
-            .where(
-                StorageFile.deleted_at.is_(None),
-                StorageFile.created_at < cutoff_time
-            )
-        )
-        db_files = result.scalars().all()
-
-        orphaned_records = []
-        for db_file in db_files:
-            file_path = self.storage_path / db_file.file_path
-            if not file_path.exists():
-                orphaned_records.append(db_file)
-
-        logger.info("Found orphaned database records", count=len(orphaned_records))
-        return orphaned_records
+        # One walk of the disk replaces an exists() check per record; it runs
+        # before the stream opens so the cursor isn't held across the walk
+        disk_paths = await _snapshot_disk_paths(self.storage_path)
 
-    async def cleanup_orphaned_files(self, dry_run: bool = True) -> dict:
+        # Stream non-deleted files from database instead of loading them all
+        db_files = await self.db.stream_scalars(
+            _SELECT_ACTIVE_FILES_BEFORE, {"cutoff": cutoff_time}
+        )
+        orphaned_count = 0
+        async for db_file in db_files:
+            if db_file.file_path not in disk_paths:
+                orphaned_count += 1
+                yield db_file
+
+        logger.info("Found orphaned database records", count=orphaned_count)
+
+    async def cleanup_orphaned_files(
+        self,
+        dry_run: bool = True,
+        active_paths: Optional[PathBloomFilter] = None
+    ) -> dict:
         """
         Clean up orphaned files from disk.
 
         Args:
             dry_run: If True, only report what would be deleted
+            active_paths: Filter over active record paths, forwarded to ``find_orphaned_files``
 
         Returns:
             Dictionary with cleanup statistics
         """
-        orphaned_files = await self.find_orphaned_files()
+        orphaned_files = await self.find_orphaned_files(active_paths=active_paths)
 
         stats = {
             "files_found": len(orphaned_files),
@@ -133,28 +576,33 @@ class StorageCleanupService:
             "errors": []
         }
 
-        for file_path in orphaned_files:
-            try:
-                # Get file size before deletion
-                file_size = file_path.stat().st_size
-
-                if not dry_run:
-                    file_path.unlink()
-                    stats["files_deleted"] += 1
-                    stats["bytes_freed"] += file_size
-                    logger.info("Deleted orphaned file", path=str(file_path), size=file_size)
-                else:
-                    stats["bytes_freed"] += file_size
-                    logger.info("Would delete orphaned file", path=str(file_path), size=file_size)
-
-            except OSError as e:
+        if dry_run:
+            for entry in orphaned_files:
+                stats["bytes_freed"] += entry.size
+                logger.info("Would delete orphaned file", path=entry.path, size=entry.size)
+            return stats
+
+        if len(orphaned_files) > BULK_UNLINK_THRESHOLD:
+            failures = await _bulk_unlink([entry.path for entry in orphaned_files])
+            outcomes = [
+                OSError(failures[entry.path]) if entry.path in failures else None
+                for entry in orphaned_files
+            ]
+        else:
+            outcomes = await _unlink_concurrently([entry.path for entry in orphaned_files])
+
+        for entry, error in zip(orphaned_files, outcomes):
+            if isinstance(error, OSError):
                 stats["files_failed"] += 1
-                error_msg = f"Failed to delete {file_path}: {e}"
+                error_msg = f"Failed to delete {entry.path}: {error}"
                 stats["errors"].append(error_msg)
-                logger.error("Failed to delete orphaned file", path=str(file_path), error=str(e))
-
-        if dry_run:
-            stats["files_deleted"] = 0  # Reset since nothing was actually deleted
+                logger.error("Failed to delete orphaned file", path=entry.path, error=str(error))
+            elif isinstance(error, BaseException):
+                raise error
+            else:
+                stats["files_deleted"] += 1
+                stats["bytes_freed"] += entry.size
+                logger.info("Deleted orphaned file", path=entry.path, size=entry.size)
 
         return stats
 
@@ -168,64 +616,62 @@ class StorageCleanupService:
         Returns:
             Dictionary with cleanup statistics
         """
-        orphaned_records = await self.find_orphaned_database_records()
-
         stats = {
-            "records_found": len(orphaned_records),
+            "records_found": 0,
             "records_deleted": 0,
             "records_failed": 0,
             "errors": []
         }
 
-        for record in orphaned_records:
+        record_ids = []
+        async for record in self.find_orphaned_database_records():
+            stats["records_found"] += 1
+            record_ids.append(record.id)
+            if dry_run:
+                logger.info("Would soft delete orphaned record", file_id=record.id, path=record.file_path)
+
+        if dry_run or not record_ids:
+            return stats
+
+        for start in range(0, len(record_ids), SOFT_DELETE_BATCH_SIZE):
+            batch = record_ids[start:start + SOFT_DELETE_BATCH_SIZE]
             try:
-                if not dry_run:
-                    # Soft delete the record
-                    record.soft_delete()
-                    stats["records_deleted"] += 1
-                    logger.info("Soft deleted orphaned record", file_id=record.id, path=record.file_path)
-                else:
-                    logger.info("Would soft delete orphaned record", file_id=record.id, path=record.file_path)
+                await self.db.execute(_SOFT_DELETE_FILES, {"ids": batch})
+                await self.db.commit()
+                stats["records_deleted"] += len(batch)
+                logger.info("Soft deleted orphaned records", count=len(batch))
 
             except Exception as e:
-                stats["records_failed"] += 1
-                error_msg = f"Failed to delete record {record.id}: {e}"
+                await self.db.rollback()
+                stats["records_failed"] += len(batch)
+                error_msg = f"Failed to delete {len(batch)} records starting at {batch[0]}: {e}"
                 stats["errors"].append(error_msg)
-                logger.error("Failed to delete orphaned record", file_id=record.id, error=str(e))
-
-        if not dry_run and stats["records_deleted"] > 0:
-            await self.db.commit()
-
-        if dry_run:
-            stats["records_deleted"] = 0  # Reset since nothing was actually deleted
+                logger.error("Failed to delete orphaned records", count=len(batch), error=str(e))
 
         return stats
 
-    async def cleanup_soft_deleted_files(self, older_than_days: int = 30, dry_run: bool = True) -> dict:
+    async def cleanup_soft_deleted_files(
+        self,
+        older_than_days: int = 30,
+        dry_run: bool = True,
+        candidates: Optional[List[Tuple[UUID, str]]] = None
+    ) -> dict:
         """
         Permanently delete files that have been soft-deleted for a specified period.
 
         Args:
             older_than_days: Delete files soft-deleted more than this many days ago
             dry_run: If True, only report what would be deleted
+            candidates: First (id, file_path) pairs in id order, as selected by
+                ``get_storage_stats_and_candidates``; queried when omitted
 
         Returns:
             Dictionary with cleanup statistics
         """
         cutoff_time = datetime.now() - timedelta(days=older_than_days)
 
-        # Get soft-deleted files older than cutoff
-        result = await self.db.execute(
-            select(StorageFile)
-            .where(
-                StorageFile.deleted_at.is_not(None),
-                StorageFile.deleted_at < cutoff_time
-            )
-        )
-        soft_deleted_files = result.scalars().all()
-
         stats = {
-            "files_found": len(soft_deleted_files),
+            "files_found": 0,
             "files_deleted": 0,
             "records_deleted": 0,
             "files_failed": 0,
@@ -233,45 +679,173 @@ class StorageCleanupService:
             "errors": []
         }
 
-        for db_file in soft_deleted_files:
+        # Purge in batches so each transaction (and its locks) stays bounded
+        async for batch in self._expired_batches(cutoff_time, candidates):
+            stats["files_found"] += len(batch)
+            await self._purge_soft_deleted_batch(batch, dry_run, stats)
+
+        if dry_run:
+            stats["files_deleted"] = 0
+            stats["records_deleted"] = 0
+
+        return stats
+
+    async def _expired_batches(
+        self,
+        cutoff_time: datetime,
+        candidates: Optional[List[Tuple[UUID, str]]]
+    ) -> AsyncIterator[List[Tuple[UUID, str]]]:
+        """
+        Yield soft-deleted files older than the cutoff, ``PURGE_BATCH_SIZE`` at a time.
+
+        Candidates handed in are yielded first; later pages are fetched by id
+        keyset, so only one batch of rows is held in memory at a time.
+
+        Args:
+            cutoff_time: Files soft-deleted before this time are yielded
+            candidates: First (id, file_path) pairs in id order, if already selected
+
+        Yields:
+            Lists of (id, file_path) pairs in id order
+        """
+        batch: List[Tuple[UUID, str]] = []
+        if candidates is None:
+            after = _FIRST_PAGE_AFTER
+        else:
+            for start in range(0, len(candidates), PURGE_BATCH_SIZE):
+                batch = candidates[start:start + PURGE_BATCH_SIZE]
+                yield batch
+            if len(batch) < PURGE_BATCH_SIZE:
+                return
+            after = batch[-1][0]
+
+        while True:
+            result = await self.db.execute(_SELECT_EXPIRED_PAGE, {"cutoff": cutoff_time, "after": after})
+            batch = [tuple(row) for row in result.all()]
+            if batch:
+                yield batch
+            if len(batch) < PURGE_BATCH_SIZE:
+                return
+            after = batch[-1][0]
+
+    async def _purge_soft_deleted_batch(
+        self,
+        batch: List[Tuple[UUID, str]],
+        dry_run: bool,
+        stats: dict
+    ) -> None:
+        """
+        Delete one batch of soft-deleted files and their records, then commit.
+
+        Args:
+            batch: (id, file_path) pairs to purge
+            dry_run: If True, only report what would be deleted
+            stats: Cleanup statistics, updated in place
+        """
+        removable_ids = await self._remove_soft_deleted_files(batch, dry_run, stats)
+
+        if dry_run:
+            for file_id in removable_ids:
+                logger.info("Would delete database record", file_id=file_id)
+            return
+
+        if not removable_ids:
+            return
+
+        # Delete database records; access logs go with them via ON DELETE CASCADE
+        try:
+            await self.db.execute(_PURGE_FILES, {"ids": removable_ids})
+            await self.db.commit()
+            stats["records_deleted"] += len(removable_ids)
+            logger.info("Deleted database records", count=len(removable_ids))
+
+        except Exception as e:
+            await self.db.rollback()
+            stats["files_failed"] += len(removable_ids)
+            error_msg = f"Failed to delete {len(removable_ids)} records starting at {removable_ids[0]}: {e}"
+            stats["errors"].append(error_msg)
+            logger.error("Failed to delete soft-deleted records", count=len(removable_ids), error=str(e))
+
+    async def _remove_soft_deleted_files(
+        self,
+        batch: List[Tuple[UUID, str]],
+        dry_run: bool,
+        stats: dict
+    ) -> List[UUID]:
+        """
+        Delete the physical files of one batch of soft-deleted records.
+
+        Args:
+            batch: (id, file_path) pairs to purge
+            dry_run: If True, only report what would be deleted
+            stats: Cleanup statistics, updated in place
+
+        Returns:
+            Ids of records whose physical file is gone, or would be in a dry run
+        """
+        # Files whose physical copy must go before the record is removed
+        pending_unlinks = []
+        removable_ids = []
+        for file_id, relative_path in batch:
             try:
-                file_path = self.storage_path / db_file.file_path
-                file_size = 0
+                file_path = self.storage_path / relative_path
 
                 # Delete physical file if it exists
                 if file_path.exists():
                     file_size = file_path.stat().st_size
                     if not dry_run:
-                        file_path.unlink()
-                        stats["files_deleted"] += 1
-                        stats["bytes_freed"] += file_size
-                        logger.info("Deleted soft-deleted file", path=str(file_path), size=file_size)
-                    else:
-                        stats["bytes_freed"] += file_size
-                        logger.info("Would delete soft-deleted file", path=str(file_path), size=file_size)
-
-                # Delete database record
-                if not dry_run:
-                    await self.db.delete(db_file)
-                    stats["records_deleted"] += 1
-                    logger.info("Deleted database record", file_id=db_file.id)
-                else:
-                    logger.info("Would delete database record", file_id=db_file.id)
+                        pending_unlinks.append((file_id, file_path, file_size))
+                        continue
+                    stats["bytes_freed"] += file_size
+                    logger.info("Would delete soft-deleted file", path=str(file_path), size=file_size)
+
+                removable_ids.append(file_id)
 
             except Exception as e:
                 stats["files_failed"] += 1
-                error_msg = f"Failed to delete {db_file.id}: {e}"
+                error_msg = f"Failed to delete {file_id}: {e}"
                 stats["errors"].append(error_msg)
-                logger.error("Failed to delete soft-deleted file", file_id=db_file.id, error=str(e))
+                logger.error("Failed to delete soft-deleted file", file_id=file_id, error=str(e))
 
-        if not dry_run and stats["records_deleted"] > 0:
-            await self.db.commit()
+        outcomes = await _unlink_concurrently([file_path for _, file_path, _ in pending_unlinks])
+        for (file_id, file_path, file_size), error in zip(pending_unlinks, outcomes):
+            if isinstance(error, BaseException):
+                stats["files_failed"] += 1
+                error_msg = f"Failed to delete {file_id}: {error}"
+                stats["errors"].append(error_msg)
+                logger.error("Failed to delete soft-deleted file", file_id=file_id, error=str(error))
+            else:
+                stats["files_deleted"] += 1
+                stats["bytes_freed"] += file_size
+                logger.info("Deleted soft-deleted file", path=str(file_path), size=file_size)
+                removable_ids.append(file_id)
+
+        return removable_ids
+
+    async def get_storage_stats_and_candidates(
+        self, older_than_days: int = 30
+    ) -> Tuple[dict, List[Tuple[UUID, str]]]:
+        """
+        Get storage statistics and the first soft-deleted cleanup candidates in one query.
 
-        if dry_run:
-            stats["files_deleted"] = 0
-            stats["records_deleted"] = 0
+        The table aggregates and the (id, file_path) arrays of the first
+        ``PURGE_BATCH_SIZE`` files soft-deleted more than ``older_than_days`` ago
+        come back in a single round-trip; ``cleanup_soft_deleted_files`` pages
+        through the rest.
 
-        return stats
+        Args:
+            older_than_days: Age in days after which soft-deleted files are candidates
+
+        Returns:
+            Tuple of (storage statistics, cleanup candidates)
+        """
+        cutoff_time = datetime.now() - timedelta(days=older_than_days)
+
+        result = await self.db.execute(_SELECT_STORAGE_STATS_AND_EXPIRED, {"cutoff": cutoff_time})
+        db_stats = result.fetchone()
+
+        candidates = list(zip(db_stats[5] or [], db_stats[6] or [])) if db_stats else []
+        return self._format_storage_stats(db_stats), candidates
 
     async def get_storage_stats(self) -> dict:
         """
@@ -280,20 +854,19 @@ class StorageCleanupService:
         Returns:
             Dictionary with storage statistics
         """
-        # Database statistics
-        result = await self.db.execute(
-            text("""
-                SELECT
-                    COUNT(*) as total_files,
-                    COUNT(CASE WHEN deleted_at IS NULL THEN 1 END) as active_files,
-                    COUNT(CASE WHEN deleted_at IS NOT NULL THEN 1 END) as deleted_files,
-                    COALESCE(SUM(CASE WHEN deleted_at IS NULL THEN file_size END), 0) as active_size,
-                    COALESCE(SUM(file_size), 0) as total_size
-                FROM storage_files
-            """)
-        )
-        db_stats = result.fetchone()
+        result = await self.db.execute(_SELECT_STORAGE_STATS)
+        return self._format_storage_stats(result.fetchone())
+
+    def _format_storage_stats(self, db_stats) -> dict:
+        """
+        Combine database aggregates with disk usage for the storage path.
+
+        Args:
+            db_stats: Row of (total, active, deleted, active_size, total_size, ...)
 
+        Returns:
+            Dictionary with storage statistics
+        """
         # Disk usage statistics
         disk_usage = {"total": 0, "used": 0, "free": 0}
         if self.storage_path.exists():
@@ -321,6 +894,75 @@ class StorageCleanupService:
         }
 
 
+async def _phase_orphaned_files(enabled: bool, dry_run: bool) -> dict:
+    """
+    Run the orphaned file cleanup phase on its own session.
+
+    Args:
+        enabled: Whether the phase should run
+        dry_run: If True, only report what would be cleaned up
+
+    Returns:
+        Phase statistics, or an empty dict when disabled
+    """
+    if not enabled:
+        return {}
+
+    logger.info("Cleaning up orphaned files")
+    async with db_manager.session_factory() as db:
+        active_paths = await _load_active_path_filter(db)
+        return await StorageCleanupService(db).cleanup_orphaned_files(dry_run, active_paths=active_paths)
+
+
+async def _phase_orphaned_records(enabled: bool, dry_run: bool) -> dict:
+    """
+    Run the orphaned database record cleanup phase on its own session.
+
+    Args:
+        enabled: Whether the phase should run
+        dry_run: If True, only report what would be cleaned up
+
+    Returns:
+        Phase statistics, or an empty dict when disabled
+    """
+    if not enabled:
+        return {}
+
+    logger.info("Cleaning up orphaned database records")
+    async with db_manager.session_factory() as db:
+        return await StorageCleanupService(db).cleanup_orphaned_database_records(dry_run)
+
+
+async def _phase_soft_deleted(
+    enabled: bool,
+    dry_run: bool,
+    older_than_days: int,
+    candidates: Optional[List[Tuple[UUID, str]]]
+) -> dict:
+    """
+    Run the soft-deleted file cleanup phase on its own session.
+
+    Args:
+        enabled: Whether the phase should run
+        dry_run: If True, only report what would be cleaned up
+        older_than_days: Days to wait before permanently deleting soft-deleted files
+        candidates: First (id, file_path) pairs from ``get_storage_stats_and_candidates``
+
+    Returns:
+        Phase statistics, or an empty dict when disabled
+    """
+    if not enabled:
+        return {}
+
+    logger.info("Cleaning up soft-deleted files")
+    async with db_manager.session_factory() as db:
+        return await StorageCleanupService(db).cleanup_soft_deleted_files(
+            older_than_days=older_than_days,
+            dry_run=dry_run,
+            candidates=candidates
+        )
+
+
 async def run_cleanup_job(
     dry_run: bool = True,
     cleanup_orphaned_files: bool = True,
@@ -343,67 +985,47 @@ async def run_cleanup_job(
     """
     logger.info("Starting storage cleanup job", dry_run=dry_run)
 
-    results = {
-        "started_at": datetime.now().isoformat(),
-        "dry_run": dry_run,
-        "orphaned_files": {},
-        "orphaned_records": {},
-        "soft_deleted": {},
-        "storage_stats": {}
-    }
-
-    async with get_db_session() as db:
-        cleanup_service = StorageCleanupService(db)
-
-        # Get initial storage stats
-        results["storage_stats"]["before"] = await cleanup_service.get_storage_stats()
+    result = CleanupResult(started_at=datetime.now().isoformat(), dry_run=dry_run)
 
-        # Clean up orphaned files
-        if cleanup_orphaned_files:
-            logger.info("Cleaning up orphaned files")
-            results["orphaned_files"] = await cleanup_service.cleanup_orphaned_files(dry_run)
-
-        # Clean up orphaned database records
-        if cleanup_orphaned_records:
-            logger.info("Cleaning up orphaned database records")
-            results["orphaned_records"] = await cleanup_service.cleanup_orphaned_database_records(dry_run)
-
-        # Clean up soft-deleted files
+    candidates = None
+    async with db_manager.session_factory() as db:
+        # Get initial storage stats, along with the first soft-deleted cleanup
+        # candidates when that phase runs
         if cleanup_soft_deleted:
-            logger.info("Cleaning up soft-deleted files")
-            results["soft_deleted"] = await cleanup_service.cleanup_soft_deleted_files(
-                older_than_days=soft_deleted_days,
-                dry_run=dry_run
+            result.storage_stats["before"], candidates = (
+                await StorageCleanupService(db).get_storage_stats_and_candidates(soft_deleted_days)
             )
+        else:
+            result.storage_stats["before"] = await StorageCleanupService(db).get_storage_stats()
+
+    # The orphan scan only counts active records as tracked, so files behind
+    # expired soft-deleted records would look orphaned; purge those first
+    result.soft_deleted = await _phase_soft_deleted(
+        cleanup_soft_deleted, dry_run, soft_deleted_days, candidates
+    )
 
+    # The remaining phases run concurrently, each on its own session
+    result.orphaned_files, result.orphaned_records = await asyncio.gather(
+        _phase_orphaned_files(cleanup_orphaned_files, dry_run),
+        _phase_orphaned_records(cleanup_orphaned_records, dry_run)
+    )
+
+    async with db_manager.session_factory() as db:
         # Get final storage stats
-        results["storage_stats"]["after"] = await cleanup_service.get_storage_stats()
+        result.storage_stats["after"] = await StorageCleanupService(db).get_storage_stats()
 
-    results["completed_at"] = datetime.now().isoformat()
+    result.completed_at = datetime.now().isoformat()
 
     # Log summary
-    total_files_cleaned = (
-        results["orphaned_files"].get("files_deleted", 0) +
-        results["soft_deleted"].get("files_deleted", 0)
-    )
-    total_records_cleaned = (
-        results["orphaned_records"].get("records_deleted", 0) +
-        results["soft_deleted"].get("records_deleted", 0)
-    )
-    total_bytes_freed = (
-        results["orphaned_files"].get("bytes_freed", 0) +
-        results["soft_deleted"].get("bytes_freed", 0)
-    )
-
     logger.info(
         "Storage cleanup job completed",
         dry_run=dry_run,
-        files_cleaned=total_files_cleaned,
-        records_cleaned=total_records_cleaned,
-        bytes_freed=total_bytes_freed
+        files_cleaned=result.files_cleaned,
+        records_cleaned=result.records_cleaned,
+        bytes_freed=result.bytes_freed
     )
 
-    return results
+    return asdict(result)
 
 
 if __name__ == "__main__":
@@ -9,8 +9,8 @@ from typing import Dict, Optional
 from uuid import UUID
 
 from app.core.models import BaseModel
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, synonym
 
 
 class FileStatus(str, Enum):
@@ -41,6 +41,9 @@ class StorageFile(BaseModel):
         comment="Unique file key in storage backend"
     )
 
+    # Local-disk cleanup addresses files by their key relative to UPLOAD_DIR
+    file_path = synonym("file_key")
+
     original_filename: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
@@ -133,6 +136,30 @@ class StorageFile(BaseModel):
     # Relationships
     workspace = relationship("Workspace", back_populates="files")
     uploader = relationship("User", foreign_keys=[uploaded_by])
+    # storage_access_logs.file_id cascades in the database, so deleting a file
+    # does not load its logs first
+    access_logs = relationship(
+        "StorageAccessLog",
+        back_populates="file",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    # Partial covering indexes so storage stats can be served by index-only scans
+    __table_args__ = (
+        Index(
+            "ix_storage_files_active",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NULL"),
+            postgresql_include=["file_size"],
+        ),
+        Index(
+            "ix_storage_files_deleted",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            postgresql_include=["file_size"],
+        ),
+    )
 
     def __repr__(self) -> str:
         """String representation of the StorageFile model."""
@@ -306,7 +333,7 @@ class StorageAccessLog(BaseModel):
     )
 
     # Relationships
-    file = relationship("StorageFile")
+    file = relationship("StorageFile", back_populates="access_logs")
     user = relationship("User", foreign_keys=[user_id])
 
     def __repr__(self) -> str:
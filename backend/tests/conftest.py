@@ -9,15 +9,19 @@ import shutil
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Generator
+from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
+
+# All models share app.core.models.Base, so these imports configure the mapper
+# registry once per process (or xdist worker); test modules importing the same
+# models afterwards only hit sys.modules
 from app.core.models import Base
+from app.core.validators import ValidationPatterns
 from app.modules.auth.models import User
-from app.modules.storage.drivers.base import BaseStorageDriver
 from app.modules.storage.models import (
     FileStatus,
     StorageFile,
@@ -34,6 +38,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
+from storage_fakes import MockStorageDriver
 
 # Test database URL for in-memory SQLite
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -342,116 +347,10 @@ def mock_redis():
         yield mock_client
 
 
-class MockStorageDriver(BaseStorageDriver):
-    """Mock storage driver for testing."""
-
-    def __init__(self, storage_path: Path):
-        self.storage_path = storage_path
-        self.files: Dict[str, bytes] = {}
-
-    async def upload_file(self, key: str, content: bytes, content_type: str = None) -> Dict[str, Any]:
-        """Mock file upload."""
-        self.files[key] = content
-        file_path = self.storage_path / key
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(content)
-
-        return {
-            "key": key,
-            "size": len(content),
-            "content_type": content_type,
-            "etag": f"mock-etag-{hash(content)}",
-            "url": f"mock://storage/{key}"
-        }
-
-    async def download_file(self, key: str) -> bytes:
-        """Mock file download."""
-        if key in self.files:
-            return self.files[key]
-
-        file_path = self.storage_path / key
-        if file_path.exists():
-            return file_path.read_bytes()
-
-        raise FileNotFoundError(f"File not found: {key}")
-
-    async def delete_file(self, key: str) -> bool:
-        """Mock file deletion."""
-        if key in self.files:
-            del self.files[key]
-
-        file_path = self.storage_path / key
-        if file_path.exists():
-            file_path.unlink()
-            return True
-
-        return False
-
-    async def file_exists(self, key: str) -> bool:
-        """Check if file exists."""
-        return key in self.files or (self.storage_path / key).exists()
-
-    async def get_file_info(self, key: str) -> Dict[str, Any]:
-        """Get file information."""
-        if not await self.file_exists(key):
-            raise FileNotFoundError(f"File not found: {key}")
-
-        file_path = self.storage_path / key
-        if file_path.exists():
-            stat = file_path.stat()
-            return {
-                "key": key,
-                "size": stat.st_size,
-                "last_modified": datetime.fromtimestamp(stat.st_mtime),
-                "etag": f"mock-etag-{stat.st_mtime}"
-            }
-
-        content = self.files[key]
-        return {
-            "key": key,
-            "size": len(content),
-            "last_modified": datetime.utcnow(),
-            "etag": f"mock-etag-{hash(content)}"
-        }
-
-    async def generate_signed_url(self, key: str, expires_in: int = 3600) -> str:
-        """Generate a mock signed URL."""
-        return f"mock://signed-url/{key}?expires={expires_in}"
-
-    async def list_files(self, prefix: str = "", limit: int = 1000) -> list:
-        """List files with optional prefix."""
-        files = []
-
-        # Check in-memory files
-        for key in self.files:
-            if key.startswith(prefix):
-                files.append({
-                    "key": key,
-                    "size": len(self.files[key]),
-                    "last_modified": datetime.utcnow()
-                })
-
-        # Check filesystem files
-        if self.storage_path.exists():
-            for file_path in self.storage_path.rglob("*"):
-                if file_path.is_file():
-                    relative_path = file_path.relative_to(self.storage_path)
-                    key = str(relative_path).replace("\\", "/")
-                    if key.startswith(prefix) and key not in self.files:
-                        stat = file_path.stat()
-                        files.append({
-                            "key": key,
-                            "size": stat.st_size,
-                            "last_modified": datetime.fromtimestamp(stat.st_mtime)
-                        })
-
-        return files[:limit]
-
-
 @pytest.fixture
-def mock_storage_driver(mock_storage_path):
-    """Create a mock storage driver."""
-    return MockStorageDriver(mock_storage_path)
+def mock_storage_driver():
+    """Create a mock storage driver for a fresh workspace."""
+    return MockStorageDriver(str(uuid4()))
 
 
 @pytest.fixture
@@ -549,7 +448,7 @@ def mock_storage_service():
 
 # Pytest configuration
 def pytest_configure(config):
-    """Configure pytest with custom markers."""
+    """Configure pytest with custom markers and warm the validation patterns."""
     config.addinivalue_line(
         "markers", "unit: mark test as a unit test"
     )
@@ -568,10 +467,29 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "workspace: mark test as workspace related"
     )
+    config.addinivalue_line(
+        "markers", "serial: mark test to run one at a time on a single xdist worker"
+    )
 
-
+    # Run each pattern once so per-process regex setup (one per xdist worker)
+    # isn't charged to the first test case that uses it
+    for pattern in (
+        ValidationPatterns.USERNAME,
+        ValidationPatterns.STRONG_PASSWORD,
+        ValidationPatterns.FILENAME,
+        ValidationPatterns.NAME,
+        ValidationPatterns.HEX_COLOR,
+        ValidationPatterns.PHONE,
+    ):
+        pattern.match("")
+        pattern.fullmatch("")
+        pattern.search("")
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test names."""
+    xdist_active = config.pluginmanager.hasplugin("xdist")
     for item in items:
         # Add markers based on test file names
         if "test_auth" in item.nodeid:
@@ -589,6 +507,12 @@ def pytest_collection_modifyitems(config, items):
         if "slow" in item.name.lower() or "integration" in item.nodeid:
             item.add_marker(pytest.mark.slow)
 
+        # Under --dist=loadgroup, keep each file on one worker and run every
+        # serial test on the same worker, one after another
+        if xdist_active:
+            group = "serial" if item.get_closest_marker("serial") else item.nodeid.split("::", 1)[0]
+            item.add_marker(pytest.mark.xdist_group(name=group))
+
 
 # Test data generators
 def generate_test_email() -> str:
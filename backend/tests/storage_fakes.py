@@ -0,0 +1,100 @@
+"""
+In-memory storage driver shared by the storage fixtures and the storage test modules.
+"""
+import bisect
+from datetime import datetime, timedelta
+from io import BytesIO
+
+from app.modules.storage.drivers.base import BaseStorageDriver
+
+
+class MockStorageDriver(BaseStorageDriver):
+    """Mock storage driver for testing."""
+
+    def __init__(self, workspace_id: str):
+        self.workspace_id = workspace_id
+        self.files = {}
+        # Keys kept sorted so prefix listing is a bisect range, not a full scan
+        self._sorted_keys: list[str] = []
+
+    def _index_key(self, file_key: str) -> None:
+        if file_key not in self.files:
+            bisect.insort(self._sorted_keys, file_key)
+
+    def _unindex_key(self, file_key: str) -> None:
+        index = bisect.bisect_left(self._sorted_keys, file_key)
+        if index < len(self._sorted_keys) and self._sorted_keys[index] == file_key:
+            self._sorted_keys.pop(index)
+
+    def get_workspace_prefix(self) -> str:
+        return f"workspace-{self.workspace_id}/"
+
+    async def upload_file(self, file_data, filename: str, content_type: str = None, metadata: dict = None) -> dict:
+        file_key = f"{self.get_workspace_prefix()}{filename}"
+        if hasattr(file_data, 'read'):
+            # Own bytes, so later writes to the caller's buffer don't leak in
+            content = file_data.read()
+        else:
+            content = file_data
+        self._index_key(file_key)
+        self.files[file_key] = {
+            "content": content,
+            "content_type": content_type,
+            "metadata": metadata or {}
+        }
+        return {"file_key": file_key, "size": len(self.files[file_key]["content"])}
+
+    async def download_file(self, file_key: str) -> tuple:
+        if file_key in self.files:
+            content = self.files[file_key]["content"]
+            return BytesIO(content), {
+                "content_type": self.files[file_key]["content_type"],
+                "size": len(content)
+            }
+        raise FileNotFoundError(f"File {file_key} not found")
+
+    async def delete_file(self, file_key: str) -> bool:
+        if file_key in self.files:
+            del self.files[file_key]
+            self._unindex_key(file_key)
+            return True
+        return False
+
+    async def list_files(self, prefix: str = None, limit: int = 100, offset: int = 0) -> list:
+        # Keys come back in lexical order, as S3 and MinIO list them, not upload order
+        if prefix:
+            lo = bisect.bisect_left(self._sorted_keys, prefix)
+            hi = bisect.bisect_left(self._sorted_keys, prefix + "\uffff", lo)
+        else:
+            lo, hi = 0, len(self._sorted_keys)
+        start = lo + offset
+        return self._sorted_keys[start:min(start + limit, hi)]
+
+    async def file_exists(self, file_key: str) -> bool:
+        return file_key in self.files
+
+    async def get_file_metadata(self, file_key: str) -> dict:
+        if file_key in self.files:
+            return self.files[file_key]["metadata"]
+        return {}
+
+    async def generate_signed_url(
+        self, file_key: str, expiration: timedelta = timedelta(hours=1), operation: str = "GET"
+    ) -> dict:
+        return {
+            "url": f"https://example.com/signed-url/{file_key}",
+            "expires_at": datetime.now() + expiration
+        }
+
+    async def copy_file(self, source_key: str, dest_key: str) -> bool:
+        if source_key in self.files:
+            self._index_key(dest_key)
+            self.files[dest_key] = self.files[source_key].copy()
+            return True
+        return False
+
+    async def move_file(self, source_key: str, dest_key: str) -> bool:
+        if await self.copy_file(source_key, dest_key):
+            await self.delete_file(source_key)
+            return True
+        return False
@@ -17,115 +17,96 @@ from app.modules.storage.schemas import (
     StorageStatsResponse,
 )
 from app.modules.storage.service import StorageService
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from storage_fakes import MockStorageDriver
 
+_WORKSPACE_ID = UUID("12345678-1234-5678-9012-123456789012")
+_USER_ID = UUID("87654321-4321-8765-2109-876543210987")
+_FILE_ID = UUID("11111111-1111-1111-1111-111111111111")
 
-class MockStorageDriver(BaseStorageDriver):
-    """Mock storage driver for testing."""
 
-    def __init__(self, workspace_id: str):
-        self.workspace_id = workspace_id
-        self.files = {}
+def _file_mock(**flags) -> Mock:
+    """Build a file record mock with the given state flags."""
+    mock_file = Mock()
+    mock_file.id = _FILE_ID
+    mock_file.file_key = "test-key"
+    for name, value in flags.items():
+        setattr(mock_file, name, value)
+    return mock_file
 
-    def get_workspace_prefix(self) -> str:
-        return f"workspace-{self.workspace_id}/"
 
-    async def upload_file(self, file_data, filename: str, content_type: str = None, metadata: dict = None) -> dict:
-        file_key = f"{self.get_workspace_prefix()}{filename}"
-        self.files[file_key] = {
-            "content": file_data.read() if hasattr(file_data, 'read') else file_data,
-            "content_type": content_type,
-            "metadata": metadata or {}
-        }
-        return {"file_key": file_key, "size": len(self.files[file_key]["content"])}
-
-    async def download_file(self, file_key: str) -> tuple:
-        if file_key in self.files:
-            content = self.files[file_key]["content"]
-            return BytesIO(content), {
-                "content_type": self.files[file_key]["content_type"],
-                "size": len(content)
-            }
-        raise FileNotFoundError(f"File {file_key} not found")
-
-    async def delete_file(self, file_key: str) -> bool:
-        if file_key in self.files:
-            del self.files[file_key]
-            return True
-        return False
-
-    async def list_files(self, prefix: str = None, limit: int = 100, offset: int = 0) -> list:
-        files = list(self.files.keys())
-        if prefix:
-            files = [f for f in files if f.startswith(prefix)]
-        return files[offset:offset + limit]
-
-    async def file_exists(self, file_key: str) -> bool:
-        return file_key in self.files
-
-    async def get_file_metadata(self, file_key: str) -> dict:
-        if file_key in self.files:
-            return self.files[file_key]["metadata"]
-        return {}
-
-    async def generate_signed_url(self, file_key: str, expiration: timedelta = timedelta(hours=1), operation: str = "GET") -> dict:
-        return {
-            "url": f"https://example.com/signed-url/{file_key}",
-            "expires_at": datetime.now() + expiration
-        }
+class _ExecDispatcher:
+    """Async stand-in for session.execute that picks a result by SQL shape."""
 
-    async def copy_file(self, source_key: str, dest_key: str) -> bool:
-        if source_key in self.files:
-            self.files[dest_key] = self.files[source_key].copy()
-            return True
-        return False
+    def __init__(self, mapping):
+        self.mapping = mapping
+        self.statements = []
 
-    async def move_file(self, source_key: str, dest_key: str) -> bool:
-        if await self.copy_file(source_key, dest_key):
-            await self.delete_file(source_key)
-            return True
-        return False
+    async def __call__(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        sql = str(stmt)
+        for key, result in self.mapping.items():
+            if key in sql:
+                return result
+        raise KeyError(sql)
 
 
-@pytest.fixture
-def mock_db_session():
-    """Mock database session."""
-    session = AsyncMock()
-    return session
+def _coro(result=None):
+    """Plain coroutine function for awaited session calls nobody asserts on."""
+    async def _f(*args, **kwargs):
+        return result
+    return _f
 
 
-@pytest.fixture
-def workspace_id():
-    """Test workspace ID."""
-    return UUID("12345678-1234-5678-9012-123456789012")
+class _NoRowResult:
+    """Stateless ``Result`` stand-in for lookups that find no row."""
+
+    __slots__ = ()
+
+    def scalar_one_or_none(self):
+        return None
+
+
+# Holds no call history, so sharing it cannot couple tests
+_NO_ROW_RESULT = _NoRowResult()
 
 
 @pytest.fixture
-def user_id():
-    """Test user ID."""
-    return UUID("87654321-4321-8765-2109-876543210987")
+def now():
+    """Single timestamp shared by every mock attribute within a test."""
+    return datetime.now(UTC)
 
 
 @pytest.mark.asyncio
 class TestStorageService:
     """Test cases for StorageService."""
 
-    async def test_upload_file_success(self):
+    @pytest.fixture(autouse=True)
+    def _noop_log(self, monkeypatch):
+        """Replace access logging with a no-op for the whole class."""
+        async def noop(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(StorageService, "_log_access", noop)
+
+    async def test_upload_file_success(self, now):
         """Test successful file upload."""
         # Create a mock session and service
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
+        user_id = _USER_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
         # Mock the driver
-        mock_driver = Mock()
+        mock_driver = Mock(spec_set=BaseStorageDriver)
         mock_upload_result = Mock()
         mock_upload_result.file_key = "test-key"
         mock_upload_result.file_size = 17
         mock_upload_result.content_type = "text/plain"
         mock_upload_result.etag = "test-etag"
-        mock_driver.upload_file = AsyncMock(return_value=mock_upload_result)
+        mock_driver.upload_file.return_value = mock_upload_result
 
         # Mock quota
         mock_quota = Mock()
@@ -136,20 +117,19 @@ class TestStorageService:
 
         with patch.object(service, 'get_driver', return_value=mock_driver), \
              patch.object(service, 'get_or_create_quota', new_callable=AsyncMock, return_value=mock_quota), \
-             patch('app.modules.storage.models.StorageFile') as mock_storage_file_class, \
-             patch.object(service, '_log_access', new_callable=AsyncMock):
+             patch('app.modules.storage.models.StorageFile') as mock_storage_file_class:
 
             # Mock StorageFile instance with all required fields
             mock_file = Mock()
-            mock_file.id = UUID("11111111-1111-1111-1111-111111111111")
+            mock_file.id = _FILE_ID
             mock_file.file_key = "test-key"
             mock_file.original_filename = "test.txt"
             mock_file.content_type = "text/plain"
             mock_file.file_size = 17
             mock_file.workspace_id = workspace_id
             mock_file.uploaded_by = user_id
-            mock_file.created_at = datetime.now(UTC)
-            mock_file.updated_at = datetime.now(UTC)
+            mock_file.created_at = now
+            mock_file.updated_at = now
             mock_file.metadata = None
 
             # Additional fields that the service tries to access
@@ -162,15 +142,15 @@ class TestStorageService:
 
             # Mock session operations
             mock_session.add = Mock()
-            mock_session.commit = AsyncMock()
+            mock_session.commit = _coro()
 
             # Mock the refresh operation to populate database-generated fields
             async def mock_refresh(obj):
-                obj.id = UUID("11111111-1111-1111-1111-111111111111")
-                obj.created_at = datetime.now(UTC)
-                obj.updated_at = datetime.now(UTC)
+                obj.id = _FILE_ID
+                obj.created_at = now
+                obj.updated_at = now
 
-            mock_session.refresh = AsyncMock(side_effect=mock_refresh)
+            mock_session.refresh = mock_refresh
 
             file_data = BytesIO(b"test file content")
 
@@ -182,13 +162,13 @@ class TestStorageService:
             )
 
             assert result is not None
-            assert result.id == UUID("11111111-1111-1111-1111-111111111111")
+            assert result.id == _FILE_ID
 
     async def test_upload_file_quota_exceeded(self):
         """Test file upload when quota is exceeded."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
+        user_id = _USER_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
@@ -211,10 +191,10 @@ class TestStorageService:
 
     async def test_download_file_success(self):
         """Test successful file download."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
+        user_id = _USER_ID
+        file_id = _FILE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
@@ -227,65 +207,40 @@ class TestStorageService:
         mock_file.is_expired = False
 
         # Mock driver
-        mock_driver = Mock()
+        mock_driver = Mock(spec_set=BaseStorageDriver)
         file_content = BytesIO(b"test content")
         metadata = {"content_type": "text/plain", "size": 12}
-        mock_driver.download_file = AsyncMock(return_value=(file_content, metadata))
+        mock_driver.download_file.return_value = (file_content, metadata)
 
         with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=mock_file), \
-             patch.object(service, 'get_driver', return_value=mock_driver), \
-             patch.object(service, '_log_access', new_callable=AsyncMock):
+             patch.object(service, 'get_driver', return_value=mock_driver):
 
             result_data, result_metadata = await service.download_file(file_id, user_id)
 
             assert result_data == file_content
             assert result_metadata == metadata
 
-    async def test_download_file_deleted(self):
-        """Test downloading a deleted file."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
+    @pytest.mark.parametrize("method,flags,status_code", [
+        ("download_file", {"is_deleted": True, "is_expired": False}, status.HTTP_404_NOT_FOUND),
+        ("download_file", {"is_deleted": False, "is_expired": True}, status.HTTP_410_GONE),
+        ("generate_signed_url", {"is_deleted": True}, status.HTTP_404_NOT_FOUND),
+    ])
+    async def test_error_paths(self, method, flags, status_code):
+        """Test deleted/expired files are rejected by download and signed URL generation."""
+        service = StorageService(db_session=Mock(spec_set=AsyncSession), workspace_id=_WORKSPACE_ID)
 
-        service = StorageService(db_session=mock_session, workspace_id=workspace_id)
-
-        # Mock deleted file
-        mock_file = Mock()
-        mock_file.is_deleted = True
-
-        with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=mock_file):
+        with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=_file_mock(**flags)):
             with pytest.raises(HTTPException) as exc_info:
-                await service.download_file(file_id, user_id)
+                await getattr(service, method)(_FILE_ID, _USER_ID)
 
-            assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
-
-    async def test_download_file_expired(self):
-        """Test downloading an expired file."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
-
-        service = StorageService(db_session=mock_session, workspace_id=workspace_id)
-
-        # Mock expired file
-        mock_file = Mock()
-        mock_file.is_deleted = False
-        mock_file.is_expired = True
-
-        with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=mock_file):
-            with pytest.raises(HTTPException) as exc_info:
-                await service.download_file(file_id, user_id)
-
-            assert exc_info.value.status_code == status.HTTP_410_GONE
+            assert exc_info.value.status_code == status_code
 
     async def test_delete_file_soft_delete(self):
         """Test soft delete of a file."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
+        user_id = _USER_ID
+        file_id = _FILE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
@@ -296,8 +251,7 @@ class TestStorageService:
 
         mock_session.commit = AsyncMock()
 
-        with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=mock_file), \
-             patch.object(service, '_log_access', new_callable=AsyncMock):
+        with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=mock_file):
 
             result = await service.delete_file(file_id, user_id, hard_delete=False)
 
@@ -307,10 +261,10 @@ class TestStorageService:
 
     async def test_delete_file_hard_delete(self):
         """Test hard delete of a file."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
+        user_id = _USER_ID
+        file_id = _FILE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
@@ -321,8 +275,8 @@ class TestStorageService:
         mock_file.file_size = 1024
 
         # Mock driver
-        mock_driver = Mock()
-        mock_driver.delete_file = AsyncMock(return_value=True)
+        mock_driver = Mock(spec_set=BaseStorageDriver)
+        mock_driver.delete_file.return_value = True
 
         # Mock quota
         mock_quota = Mock()
@@ -330,12 +284,11 @@ class TestStorageService:
         mock_quota.used_files = 5
 
         mock_session.delete = AsyncMock()
-        mock_session.commit = AsyncMock()
+        mock_session.commit = _coro()
 
         with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=mock_file), \
              patch.object(service, 'get_driver', return_value=mock_driver), \
-             patch.object(service, 'get_or_create_quota', new_callable=AsyncMock, return_value=mock_quota), \
-             patch.object(service, '_log_access', new_callable=AsyncMock):
+             patch.object(service, 'get_or_create_quota', new_callable=AsyncMock, return_value=mock_quota):
 
             result = await service.delete_file(file_id, user_id, hard_delete=True)
 
@@ -345,17 +298,17 @@ class TestStorageService:
             assert mock_quota.used_files == 4  # 5 - 1
             mock_session.delete.assert_called_once_with(mock_file)
 
-    async def test_list_files_success(self):
+    async def test_list_files_success(self, now):
         """Test successful file listing."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
         # Mock files
         mock_files = [
             Mock(
-                id=UUID("11111111-1111-1111-1111-111111111111"),
+                id=_FILE_ID,
                 file_key="file1.txt",
                 original_filename="file1.txt",
                 content_type="text/plain",
@@ -363,8 +316,8 @@ class TestStorageService:
                 folder_path=None,
                 tags=None,
                 is_public=False,
-                uploaded_by=UUID("87654321-4321-8765-2109-876543210987"),
-                created_at=datetime.now(UTC),
+                uploaded_by=_USER_ID,
+                created_at=now,
                 expires_at=None
             ),
             Mock(
@@ -376,8 +329,8 @@ class TestStorageService:
                 folder_path="documents",
                 tags={"category": "test"},
                 is_public=True,
-                uploaded_by=UUID("87654321-4321-8765-2109-876543210987"),
-                created_at=datetime.now(UTC),
+                uploaded_by=_USER_ID,
+                created_at=now,
                 expires_at=None
             )
         ]
@@ -389,7 +342,7 @@ class TestStorageService:
         mock_count_result = Mock()
         mock_count_result.scalar.return_value = 2
 
-        mock_session.execute = AsyncMock(side_effect=[mock_count_result, mock_result])
+        mock_session.execute = _ExecDispatcher({"count(": mock_count_result, "SELECT": mock_result})
 
         result = await service.list_files(limit=10, offset=0)
 
@@ -399,12 +352,12 @@ class TestStorageService:
         assert result.offset == 0
         assert result.has_more is False
 
-    async def test_generate_signed_url_success(self):
+    async def test_generate_signed_url_success(self, now):
         """Test successful signed URL generation."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
+        user_id = _USER_ID
+        file_id = _FILE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
@@ -415,44 +368,24 @@ class TestStorageService:
         mock_file.is_deleted = False
 
         # Mock driver
-        mock_driver = Mock()
+        mock_driver = Mock(spec_set=BaseStorageDriver)
         mock_signed_url = Mock()
         mock_signed_url.url = "https://example.com/signed-url"
-        mock_signed_url.expires_at = datetime.now(UTC) + timedelta(hours=1)
-        mock_driver.generate_signed_url = AsyncMock(return_value=mock_signed_url)
+        mock_signed_url.expires_at = now + timedelta(hours=1)
+        mock_driver.generate_signed_url.return_value = mock_signed_url
 
         with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=mock_file), \
-             patch.object(service, 'get_driver', return_value=mock_driver), \
-             patch.object(service, '_log_access', new_callable=AsyncMock):
+             patch.object(service, 'get_driver', return_value=mock_driver):
 
             result = await service.generate_signed_url(file_id, user_id, operation="GET")
 
             assert result == mock_signed_url
             mock_driver.generate_signed_url.assert_called_once()
 
-    async def test_generate_signed_url_deleted_file(self):
-        """Test signed URL generation for deleted file."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
-
-        service = StorageService(db_session=mock_session, workspace_id=workspace_id)
-
-        # Mock deleted file
-        mock_file = Mock()
-        mock_file.is_deleted = True
-
-        with patch.object(service, '_get_file_or_404', new_callable=AsyncMock, return_value=mock_file):
-            with pytest.raises(HTTPException) as exc_info:
-                await service.generate_signed_url(file_id, user_id)
-
-            assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
-
     async def test_get_storage_stats(self):
         """Test getting storage statistics."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
@@ -473,7 +406,7 @@ class TestStorageService:
         mock_status_row.total_size = 800000
         mock_status_result.__iter__ = Mock(return_value=iter([mock_status_row]))
 
-        mock_session.execute = AsyncMock(return_value=mock_status_result)
+        mock_session.execute = _coro(mock_status_result)
 
         with patch.object(service, 'get_or_create_quota', new_callable=AsyncMock, return_value=mock_quota):
             result = await service.get_storage_stats()
@@ -488,8 +421,8 @@ class TestStorageService:
 
     async def test_get_or_create_quota_existing(self):
         """Test getting existing quota."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
@@ -497,24 +430,22 @@ class TestStorageService:
         mock_quota = Mock()
         mock_result = Mock()
         mock_result.scalar_one_or_none.return_value = mock_quota
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.execute = _ExecDispatcher({"storage_quotas": mock_result})
 
         result = await service.get_or_create_quota()
 
         assert result == mock_quota
-        mock_session.execute.assert_called_once()
+        assert len(mock_session.execute.statements) == 1
 
     async def test_get_or_create_quota_new(self):
         """Test creating new quota."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
         # Mock no existing quota
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.execute = _ExecDispatcher({"storage_quotas": _NO_ROW_RESULT})
         mock_session.add = Mock()
         mock_session.commit = AsyncMock()
         mock_session.refresh = AsyncMock()
@@ -532,9 +463,9 @@ class TestStorageService:
 
     async def test_get_file_or_404_found(self):
         """Test getting file when it exists."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
+        file_id = _FILE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
@@ -542,7 +473,7 @@ class TestStorageService:
         mock_file = Mock()
         mock_result = Mock()
         mock_result.scalar_one_or_none.return_value = mock_file
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.execute = _ExecDispatcher({"storage_files": mock_result})
 
         result = await service._get_file_or_404(file_id)
 
@@ -550,31 +481,30 @@ class TestStorageService:
 
     async def test_get_file_or_404_not_found(self):
         """Test getting file when it doesn't exist."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
+        file_id = _FILE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
         # Mock file not found
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.execute = _ExecDispatcher({"storage_files": _NO_ROW_RESULT})
 
         with pytest.raises(HTTPException) as exc_info:
             await service._get_file_or_404(file_id)
 
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
-    async def test_log_access_success(self):
+    async def test_log_access_success(self, monkeypatch):
         """Test successful access logging."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
+        monkeypatch.undo()  # exercise the real _log_access
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
+        file_id = _FILE_ID
+        user_id = _USER_ID
 
         mock_session.add = Mock()
         mock_session.commit = AsyncMock()
@@ -588,15 +518,16 @@ class TestStorageService:
             mock_session.add.assert_called_once_with(mock_log)
             mock_session.commit.assert_called_once()
 
-    async def test_log_access_failure(self):
+    async def test_log_access_failure(self, monkeypatch):
         """Test access logging failure doesn't break main operation."""
-        mock_session = Mock()
-        workspace_id = UUID("12345678-1234-5678-9012-123456789012")
+        monkeypatch.undo()  # exercise the real _log_access
+        mock_session = Mock(spec_set=AsyncSession)
+        workspace_id = _WORKSPACE_ID
 
         service = StorageService(db_session=mock_session, workspace_id=workspace_id)
 
-        file_id = UUID("11111111-1111-1111-1111-111111111111")
-        user_id = UUID("87654321-4321-8765-2109-876543210987")
+        file_id = _FILE_ID
+        user_id = _USER_ID
 
         mock_session.add = Mock(side_effect=Exception("Database error"))
 
@@ -607,27 +538,27 @@ class TestStorageService:
     async def test_minio_driver_initialization(self):
         """Test MinIO driver initialization."""
         driver = MinIOStorageDriver(
-            workspace_id=UUID("12345678-1234-5678-9012-123456789012"),
+            workspace_id=_WORKSPACE_ID,
             endpoint="localhost:9000",
             access_key="minioadmin",
             secret_key="minioadmin",
             secure=False
         )
 
-        assert driver.workspace_id == UUID("12345678-1234-5678-9012-123456789012")
+        assert driver.workspace_id == _WORKSPACE_ID
         assert driver.bucket_name == f"workspace-{str(UUID('12345678-1234-5678-9012-123456789012')).lower()}"
 
     async def test_s3_driver_initialization(self):
         """Test S3 driver initialization."""
         driver = S3StorageDriver(
-            workspace_id=UUID("12345678-1234-5678-9012-123456789012"),
+            workspace_id=_WORKSPACE_ID,
             bucket_name="test-bucket",
             aws_access_key_id="test-key",
             aws_secret_access_key="test-secret",
             region_name="us-east-1"
         )
 
-        assert driver.workspace_id == UUID("12345678-1234-5678-9012-123456789012")
+        assert driver.workspace_id == _WORKSPACE_ID
         assert driver.bucket_name == "test-bucket"
 
 
@@ -642,8 +573,8 @@ class TestStorageModels:
             "content_type": "text/plain",
             "file_size": 1024,
             "storage_provider": StorageProvider.MINIO,
-            "workspace_id": UUID("12345678-1234-5678-9012-123456789012"),
-            "uploaded_by": UUID("12345678-1234-5678-9012-123456789012")
+            "workspace_id": _WORKSPACE_ID,
+            "uploaded_by": _WORKSPACE_ID
         }
 
         storage_file = StorageFile(**file_data)
@@ -661,8 +592,8 @@ class TestStorageModels:
             "content_type": "text/plain",
             "file_size": 1024,
             "storage_provider": StorageProvider.MINIO,
-            "workspace_id": UUID("12345678-1234-5678-9012-123456789012"),
-            "uploaded_by": UUID("12345678-1234-5678-9012-123456789012")
+            "workspace_id": _WORKSPACE_ID,
+            "uploaded_by": _WORKSPACE_ID
         }
 
         storage_file = StorageFile(**file_data)
@@ -690,6 +621,10 @@ class TestMockStorageDriver:
         assert "file_key" in result
         assert result["size"] == 12
 
+        # Reusing the caller's buffer must not change the stored content
+        file_data.seek(0)
+        file_data.write(b"XXXX")
+
         # Download file
         content, metadata = await driver.download_file(result["file_key"])
         assert content.read() == b"test content"
@@ -715,5 +650,43 @@ class TestMockStorageDriver:
         assert not await driver.file_exists(result["file_key"])
 
 
+    @pytest.mark.asyncio
+    async def test_mock_driver_list_files_prefix_offset_limit(self):
+        """Test listing returns keys in lexical order, windowed by prefix, offset and limit."""
+        driver = MockStorageDriver("test-workspace")
+        for filename in ("docs/c.txt", "images/a.png", "docs/a.txt", "docs/b.txt"):
+            await driver.upload_file(BytesIO(b"x"), filename)
+        prefix = f"{driver.get_workspace_prefix()}docs/"
+
+        # Key order, not upload order
+        assert await driver.list_files() == [
+            f"{driver.get_workspace_prefix()}{name}"
+            for name in ("docs/a.txt", "docs/b.txt", "docs/c.txt", "images/a.png")
+        ]
+        assert await driver.list_files(prefix=prefix) == [
+            f"{prefix}a.txt", f"{prefix}b.txt", f"{prefix}c.txt"
+        ]
+        assert await driver.list_files(prefix=prefix, offset=1, limit=1) == [f"{prefix}b.txt"]
+        assert await driver.list_files(prefix=prefix, offset=5) == []
+
+    @pytest.mark.asyncio
+    async def test_mock_driver_delete_unindexes_key(self):
+        """Test deleted keys leave the listing index and re-uploads are listed once."""
+        driver = MockStorageDriver("test-workspace")
+        first = await driver.upload_file(BytesIO(b"x"), "a.txt")
+        second = await driver.upload_file(BytesIO(b"x"), "b.txt")
+
+        await driver.delete_file(first["file_key"])
+        assert await driver.list_files() == [second["file_key"]]
+
+        # Overwriting an existing key does not list it twice
+        await driver.upload_file(BytesIO(b"y"), "b.txt")
+        assert await driver.list_files() == [second["file_key"]]
+
+        # A move unindexes the source and indexes the destination
+        moved_key = f"{driver.get_workspace_prefix()}c.txt"
+        assert await driver.move_file(second["file_key"], moved_key)
+        assert await driver.list_files() == [moved_key]
+
 if __name__ == "__main__":
     pytest.main([__file__])
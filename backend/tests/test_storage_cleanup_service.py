@@ -4,14 +4,25 @@ Unit tests for StorageCleanupService.
 This module contains comprehensive tests for the storage cleanup functionality,
 including orphaned file detection, database record cleanup, and storage statistics.
 """
+import asyncio
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import UUID
 
 import pytest
-from app.modules.storage.cleanup import StorageCleanupService, run_cleanup_job
+from app.core.database import db_manager
+from app.modules.storage.cleanup import (
+    OrphanEntry,
+    PathBloomFilter,
+    StorageCleanupService,
+    _parallel_scan,
+    _upload_path,
+    run_cleanup_job,
+)
 from app.modules.storage.models import StorageFile
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 
 @pytest.fixture
@@ -20,10 +31,18 @@ def mock_db_session():
     session = Mock()
     session.execute = AsyncMock()
     session.commit = AsyncMock()
+    session.rollback = AsyncMock()
     session.delete = AsyncMock()
+    session.stream_scalars = AsyncMock()
     return session
 
 
+async def _async_iter(items):
+    """Async iterator standing in for a streamed SQLAlchemy result."""
+    for item in items:
+        yield item
+
+
 @pytest.fixture
 def mock_storage_file():
     """Mock storage file record."""
@@ -40,10 +59,12 @@ def mock_storage_file():
 @pytest.fixture
 def cleanup_service(mock_db_session):
     """Create StorageCleanupService instance with mocked dependencies."""
+    _upload_path.cache_clear()
     with patch('app.modules.storage.cleanup.get_settings') as mock_settings:
         mock_settings.return_value.UPLOAD_DIR = "/tmp/test_storage"
         service = StorageCleanupService(mock_db_session)
-        return service
+    _upload_path.cache_clear()
+    return service
 
 
 @pytest.mark.asyncio
@@ -52,118 +73,225 @@ class TestStorageCleanupService:
 
     async def test_init(self, mock_db_session):
         """Test service initialization."""
+        _upload_path.cache_clear()
         with patch('app.modules.storage.cleanup.get_settings') as mock_settings:
             mock_settings.return_value.UPLOAD_DIR = "/tmp/test_storage"
 
             service = StorageCleanupService(mock_db_session)
+            second = StorageCleanupService(mock_db_session)
 
             assert service.db == mock_db_session
             assert service.storage_path == Path("/tmp/test_storage")
+            # Settings are read once and the Path is shared between instances
+            assert second.storage_path is service.storage_path
+            mock_settings.assert_called_once()
+        _upload_path.cache_clear()
 
-    async def test_find_orphaned_files_no_storage_path(self, cleanup_service):
+    async def test_find_orphaned_files_no_storage_path(self, cleanup_service, tmp_path):
         """Test finding orphaned files when storage path doesn't exist."""
-        with patch.object(cleanup_service.storage_path, 'exists', return_value=False):
-            result = await cleanup_service.find_orphaned_files()
+        cleanup_service.storage_path = tmp_path / "missing"
 
-            assert result == []
+        result = await cleanup_service.find_orphaned_files()
 
-    async def test_find_orphaned_files_success(self, cleanup_service, mock_db_session):
+        assert result == []
+
+    async def test_find_orphaned_files_success(self, cleanup_service, mock_db_session, tmp_path):
         """Test successful orphaned file detection."""
-        # Mock database query result
+        cleanup_service.storage_path = tmp_path
+        active_paths = PathBloomFilter(capacity=2)
+        active_paths.add("existing/file.txt")
+        active_paths.add("another/file.txt")
+
+        # Mock confirmation query for filter hits
         mock_result = Mock()
-        mock_result.fetchall.return_value = [("existing/file.txt",), ("another/file.txt",)]
+        mock_result.fetchall.return_value = [("existing/file.txt",)]
         mock_db_session.execute.return_value = mock_result
 
-        # Mock file system
-        mock_files = [
-            Mock(spec=Path),  # orphaned file
-            Mock(spec=Path),  # existing file
+        # Mock files reported by the scan as older than the cutoff
+        old_files = [
+            OrphanEntry(str(tmp_path / "orphaned" / "file.txt"), 1024),  # orphaned file
+            OrphanEntry(str(tmp_path / "existing" / "file.txt"), 1024),  # existing file
         ]
 
-        # Configure first file (orphaned)
-        mock_files[0].is_file.return_value = True
-        mock_files[0].stat.return_value.st_mtime = (datetime.now() - timedelta(hours=25)).timestamp()
-        mock_files[0].relative_to.return_value = Path("orphaned/file.txt")
-        mock_files[0].__str__ = lambda: "/tmp/test_storage/orphaned/file.txt"
+        with patch('app.modules.storage.cleanup._parallel_scan', AsyncMock(return_value=old_files)) as mock_scan:
+            result = await cleanup_service.find_orphaned_files(active_paths=active_paths)
+
+            assert result == [old_files[0]]
+            mock_scan.assert_awaited_once()
+            assert mock_scan.await_args.args[0] == tmp_path
 
-        # Configure second file (exists in DB)
-        mock_files[1].is_file.return_value = True
-        mock_files[1].stat.return_value.st_mtime = (datetime.now() - timedelta(hours=25)).timestamp()
-        mock_files[1].relative_to.return_value = Path("existing/file.txt")
-        mock_files[1].__str__ = lambda: "/tmp/test_storage/existing/file.txt"
+            # Only the filter hit is confirmed against the database
+            mock_db_session.execute.assert_called_once()
+            _, params = mock_db_session.execute.call_args.args
+            assert params == {"paths": ["existing/file.txt"]}
 
-        with patch.object(cleanup_service.storage_path, 'exists', return_value=True), \
-             patch.object(cleanup_service.storage_path, 'rglob', return_value=mock_files):
+    async def test_find_orphaned_files_bloom_negative(self, cleanup_service, mock_db_session, tmp_path):
+        """Test filter misses are reported as orphans without a confirmation query."""
+        cleanup_service.storage_path = tmp_path
+        active_paths = PathBloomFilter(capacity=1000)
+        for i in range(1000):
+            active_paths.add(f"tracked/file{i}.txt")
+
+        old_files = [OrphanEntry(str(tmp_path / "untracked" / f"file{i}.txt"), 1024) for i in range(50)]
+
+        with patch('app.modules.storage.cleanup._parallel_scan', AsyncMock(return_value=old_files)):
+            result = await cleanup_service.find_orphaned_files(active_paths=active_paths)
+
+            assert result == old_files
+            mock_db_session.execute.assert_not_called()
+
+    async def test_find_orphaned_files_looks_up_candidates(self, cleanup_service, mock_db_session, tmp_path):
+        """Test standalone orphaned file detection looks up only the on-disk candidates."""
+        cleanup_service.storage_path = tmp_path
+
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [("existing/file.txt",)]
+        mock_db_session.execute.return_value = mock_result
 
+        old_files = [
+            OrphanEntry(str(tmp_path / "orphaned" / "file.txt"), 1024),
+            OrphanEntry(str(tmp_path / "existing" / "file.txt"), 1024),
+        ]
+
+        with patch('app.modules.storage.cleanup._parallel_scan', AsyncMock(return_value=old_files)):
             result = await cleanup_service.find_orphaned_files()
 
-            assert len(result) == 1
-            assert result[0] == mock_files[0]
+            assert result == [old_files[0]]
+            mock_db_session.execute.assert_called_once()
+            stmt, params = mock_db_session.execute.call_args.args
+            assert " IN " in str(stmt)
+            assert params == {"paths": ["orphaned/file.txt", "existing/file.txt"]}
 
-    async def test_find_orphaned_files_recent_files_ignored(self, cleanup_service, mock_db_session):
+    async def test_find_orphaned_files_recent_files_ignored(self, cleanup_service, mock_db_session, tmp_path):
         """Test that recent files are ignored in orphaned file detection."""
+        cleanup_service.storage_path = tmp_path
+
         # Mock database query result
         mock_result = Mock()
         mock_result.fetchall.return_value = []
         mock_db_session.execute.return_value = mock_result
 
-        # Mock recent file
-        mock_file = Mock(spec=Path)
-        mock_file.is_file.return_value = True
-        mock_file.stat.return_value.st_mtime = datetime.now().timestamp()  # Recent file
+        # Recent file on disk
+        (tmp_path / "recent.txt").write_bytes(b"x" * 1024)
+
+        result = await cleanup_service.find_orphaned_files()
+
+        assert result == []
+
+    async def test_find_orphaned_files_parallel(self, cleanup_service, mock_db_session, tmp_path):
+        """Test the parallel scan discovers every leaf of a branching tree."""
+        cleanup_service.storage_path = tmp_path
 
-        with patch.object(cleanup_service.storage_path, 'exists', return_value=True), \
-             patch.object(cleanup_service.storage_path, 'rglob', return_value=[mock_file]):
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+        mock_db_session.execute.return_value = mock_result
 
+        old_mtime = time.time() - 90000
+        root = str(tmp_path)
+
+        def entry(path, is_dir):
+            mock_entry = Mock(path=path)
+            mock_entry.is_dir.return_value = is_dir
+            mock_entry.is_file.return_value = not is_dir
+            mock_entry.stat.return_value = Mock(st_mtime=old_mtime, st_size=10)
+            return mock_entry
+
+        # root -> a, b; a -> a1, a2; each leaf directory holds one file
+        tree = {
+            root: [entry(f"{root}/a", True), entry(f"{root}/b", True), entry(f"{root}/top.txt", False)],
+            f"{root}/a": [entry(f"{root}/a/a1", True), entry(f"{root}/a/a2", True)],
+            f"{root}/b": [entry(f"{root}/b/b.txt", False)],
+            f"{root}/a/a1": [entry(f"{root}/a/a1/a1.txt", False)],
+            f"{root}/a/a2": [entry(f"{root}/a/a2/a2.txt", False)],
+        }
+
+        def fake_scandir(path):
+            iterator = MagicMock()
+            iterator.__enter__.return_value = iter(tree[path])
+            return iterator
+
+        with patch('app.modules.storage.cleanup.os.scandir', side_effect=fake_scandir) as mock_scandir:
             result = await cleanup_service.find_orphaned_files()
 
-            assert result == []
+        assert sorted(entry.path[len(root) + 1:] for entry in result) == [
+            "a/a1/a1.txt", "a/a2/a2.txt", "b/b.txt", "top.txt"
+        ]
+        assert mock_scandir.call_count == len(tree)
+
+    async def test_parallel_scan_worker_failure(self, tmp_path):
+        """Test a non-OSError from one scandir fails the scan instead of hanging it."""
+        root = str(tmp_path)
+
+        def entry(path):
+            mock_entry = Mock(path=path)
+            mock_entry.is_dir.return_value = True
+            return mock_entry
+
+        def fake_scandir(path):
+            if path == f"{root}/bad":
+                raise RuntimeError("scandir exploded")
+            iterator = MagicMock()
+            children = [entry(f"{root}/bad"), entry(f"{root}/good")] if path == root else []
+            iterator.__enter__.return_value = iter(children)
+            return iterator
+
+        with patch('app.modules.storage.cleanup.os.scandir', side_effect=fake_scandir):
+            with pytest.raises(RuntimeError, match="scandir exploded"):
+                await asyncio.wait_for(_parallel_scan(tmp_path, time.time(), workers=2), timeout=5)
 
     async def test_find_orphaned_database_records_success(self, cleanup_service, mock_db_session, mock_storage_file):
         """Test successful orphaned database record detection."""
-        # Mock database query result
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = [mock_storage_file]
-        mock_db_session.execute.return_value = mock_result
+        # Mock streamed database query result
+        mock_db_session.stream_scalars.return_value = _async_iter([mock_storage_file])
 
-        # Mock file doesn't exist on disk
-        with patch.object(cleanup_service.storage_path, '__truediv__') as mock_div:
-            mock_file_path = Mock()
-            mock_file_path.exists.return_value = False
-            mock_div.return_value = mock_file_path
+        async def snapshot(root):
+            # The disk walk finishes before the database cursor is opened
+            mock_db_session.stream_scalars.assert_not_called()
+            return frozenset()
 
-            result = await cleanup_service.find_orphaned_database_records()
+        # Mock file doesn't exist on disk
+        with patch('app.modules.storage.cleanup._snapshot_disk_paths', side_effect=snapshot):
+            result = [record async for record in cleanup_service.find_orphaned_database_records()]
 
             assert len(result) == 1
             assert result[0] == mock_storage_file
+            mock_db_session.stream_scalars.assert_awaited_once()
 
     async def test_find_orphaned_database_records_file_exists(self, cleanup_service, mock_db_session, mock_storage_file):
         """Test orphaned database record detection when file exists on disk."""
-        # Mock database query result
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = [mock_storage_file]
-        mock_db_session.execute.return_value = mock_result
+        # Mock streamed database query result
+        mock_db_session.stream_scalars.return_value = _async_iter([mock_storage_file])
 
         # Mock file exists on disk
-        with patch.object(cleanup_service.storage_path, '__truediv__') as mock_div:
-            mock_file_path = Mock()
-            mock_file_path.exists.return_value = True
-            mock_div.return_value = mock_file_path
-
-            result = await cleanup_service.find_orphaned_database_records()
+        with patch('app.modules.storage.cleanup._snapshot_disk_paths',
+                   AsyncMock(return_value=frozenset({"test/file.txt"}))):
+            result = [record async for record in cleanup_service.find_orphaned_database_records()]
 
             assert result == []
 
-    async def test_cleanup_orphaned_files_dry_run(self, cleanup_service):
+    async def test_find_orphaned_database_records_disk_snapshot(self, cleanup_service, mock_db_session, tmp_path):
+        """Test records are matched against one snapshot of the files on disk."""
+        cleanup_service.storage_path = tmp_path
+        (tmp_path / "kept").mkdir()
+        (tmp_path / "kept" / "file.txt").write_bytes(b"x")
+
+        records = [Mock(spec=StorageFile, file_path=path) for path in ("kept/file.txt", "gone/file.txt")]
+        mock_db_session.stream_scalars.return_value = _async_iter(records)
+
+        with patch('os.path.exists') as mock_exists:
+            result = [record async for record in cleanup_service.find_orphaned_database_records()]
+
+            assert result == [records[1]]
+            mock_exists.assert_not_called()
+
+    async def test_cleanup_orphaned_files_dry_run(self, cleanup_service, tmp_path):
         """Test orphaned file cleanup in dry run mode."""
-        # Mock orphaned files
-        mock_files = [Mock(spec=Path), Mock(spec=Path)]
-        mock_files[0].stat.return_value.st_size = 1024
-        mock_files[0].__str__ = lambda: "/tmp/test_storage/file1.txt"
-        mock_files[1].stat.return_value.st_size = 2048
-        mock_files[1].__str__ = lambda: "/tmp/test_storage/file2.txt"
-
-        with patch.object(cleanup_service, 'find_orphaned_files', return_value=mock_files):
+        # Orphaned files on disk
+        (tmp_path / "file1.txt").write_bytes(b"x" * 1024)
+        (tmp_path / "file2.txt").write_bytes(b"x" * 2048)
+        orphans = [OrphanEntry(str(tmp_path / "file1.txt"), 1024), OrphanEntry(str(tmp_path / "file2.txt"), 2048)]
+
+        with patch.object(cleanup_service, 'find_orphaned_files', return_value=orphans):
             result = await cleanup_service.cleanup_orphaned_files(dry_run=True)
 
             assert result["files_found"] == 2
@@ -173,19 +301,17 @@ class TestStorageCleanupService:
             assert result["errors"] == []
 
             # Verify files were not actually deleted
-            mock_files[0].unlink.assert_not_called()
-            mock_files[1].unlink.assert_not_called()
+            assert (tmp_path / "file1.txt").exists()
+            assert (tmp_path / "file2.txt").exists()
 
-    async def test_cleanup_orphaned_files_actual_cleanup(self, cleanup_service):
+    async def test_cleanup_orphaned_files_actual_cleanup(self, cleanup_service, tmp_path):
         """Test actual orphaned file cleanup."""
-        # Mock orphaned files
-        mock_files = [Mock(spec=Path), Mock(spec=Path)]
-        mock_files[0].stat.return_value.st_size = 1024
-        mock_files[0].__str__ = lambda: "/tmp/test_storage/file1.txt"
-        mock_files[1].stat.return_value.st_size = 2048
-        mock_files[1].__str__ = lambda: "/tmp/test_storage/file2.txt"
-
-        with patch.object(cleanup_service, 'find_orphaned_files', return_value=mock_files):
+        # Orphaned files on disk
+        (tmp_path / "file1.txt").write_bytes(b"x" * 1024)
+        (tmp_path / "file2.txt").write_bytes(b"x" * 2048)
+        orphans = [OrphanEntry(str(tmp_path / "file1.txt"), 1024), OrphanEntry(str(tmp_path / "file2.txt"), 2048)]
+
+        with patch.object(cleanup_service, 'find_orphaned_files', return_value=orphans):
             result = await cleanup_service.cleanup_orphaned_files(dry_run=False)
 
             assert result["files_found"] == 2
@@ -195,20 +321,23 @@ class TestStorageCleanupService:
             assert result["errors"] == []
 
             # Verify files were actually deleted
-            mock_files[0].unlink.assert_called_once()
-            mock_files[1].unlink.assert_called_once()
+            assert not (tmp_path / "file1.txt").exists()
+            assert not (tmp_path / "file2.txt").exists()
 
     async def test_cleanup_orphaned_files_with_errors(self, cleanup_service):
         """Test orphaned file cleanup with errors."""
-        # Mock orphaned files
-        mock_files = [Mock(spec=Path), Mock(spec=Path)]
-        mock_files[0].stat.return_value.st_size = 1024
-        mock_files[0].unlink.side_effect = OSError("Permission denied")
-        mock_files[0].__str__ = lambda: "/tmp/test_storage/file1.txt"
-        mock_files[1].stat.return_value.st_size = 2048
-        mock_files[1].__str__ = lambda: "/tmp/test_storage/file2.txt"
-
-        with patch.object(cleanup_service, 'find_orphaned_files', return_value=mock_files):
+        orphans = [
+            OrphanEntry("/tmp/test_storage/file1.txt", 1024),
+            OrphanEntry("/tmp/test_storage/file2.txt", 2048),
+        ]
+
+        def fake_unlink(path):
+            # Raised on the worker thread and surfaced through gather(return_exceptions=True)
+            if path == orphans[0].path:
+                raise OSError("Permission denied")
+
+        with patch.object(cleanup_service, 'find_orphaned_files', return_value=orphans), \
+             patch('app.modules.storage.cleanup.os.unlink', side_effect=fake_unlink):
             result = await cleanup_service.cleanup_orphaned_files(dry_run=False)
 
             assert result["files_found"] == 2
@@ -218,9 +347,58 @@ class TestStorageCleanupService:
             assert len(result["errors"]) == 1
             assert "Permission denied" in result["errors"][0]
 
+    async def test_cleanup_orphaned_files_bulk_rm(self, cleanup_service):
+        """Test large orphan sets are removed by one rm subprocess."""
+        orphans = [OrphanEntry(f"/tmp/test_storage/file{i}.txt", 100) for i in range(40)]
+
+        mock_proc = Mock(returncode=1)
+        mock_proc.communicate = AsyncMock(
+            return_value=(b"", b"rm: cannot remove '/tmp/test_storage/file3.txt': Permission denied\n")
+        )
+
+        with patch.object(cleanup_service, 'find_orphaned_files', return_value=orphans), \
+             patch('app.modules.storage.cleanup.os.unlink') as mock_unlink, \
+             patch('app.modules.storage.cleanup.os.path.lexists',
+                   side_effect=lambda path: path == orphans[3].path), \
+             patch('app.modules.storage.cleanup.asyncio.create_subprocess_exec',
+                   AsyncMock(return_value=mock_proc)) as mock_exec:
+            result = await cleanup_service.cleanup_orphaned_files(dry_run=False)
+
+            mock_exec.assert_awaited_once()
+            args = mock_exec.await_args.args
+            assert args[:3] == ("rm", "-f", "--")
+            assert len(args[3:]) == 40
+            assert mock_exec.await_args.kwargs["env"]["LC_ALL"] == "C"
+
+            assert result["files_found"] == 40
+            assert result["files_deleted"] == 39
+            assert result["files_failed"] == 1
+            assert result["bytes_freed"] == 3900
+            assert "Permission denied" in result["errors"][0]
+            mock_unlink.assert_not_called()
+
+    async def test_cleanup_orphaned_files_bulk_rm_unparsed_failure(self, cleanup_service):
+        """Test rm failures are detected from the file system, not from stderr wording."""
+        orphans = [OrphanEntry(f"/tmp/test_storage/file{i}.txt", 100) for i in range(40)]
+
+        mock_proc = Mock(returncode=1)
+        mock_proc.communicate = AsyncMock(return_value=(b"", "rm: impossible de supprimer\n".encode()))
+
+        with patch.object(cleanup_service, 'find_orphaned_files', return_value=orphans), \
+             patch('app.modules.storage.cleanup.os.path.lexists',
+                   side_effect=lambda path: path == orphans[7].path), \
+             patch('app.modules.storage.cleanup.asyncio.create_subprocess_exec',
+                   AsyncMock(return_value=mock_proc)):
+            result = await cleanup_service.cleanup_orphaned_files(dry_run=False)
+
+            assert result["files_deleted"] == 39
+            assert result["files_failed"] == 1
+            assert orphans[7].path in result["errors"][0]
+            assert "rm exited with status 1" in result["errors"][0]
+
     async def test_cleanup_orphaned_database_records_dry_run(self, cleanup_service, mock_storage_file):
         """Test orphaned database record cleanup in dry run mode."""
-        with patch.object(cleanup_service, 'find_orphaned_database_records', return_value=[mock_storage_file]):
+        with patch.object(cleanup_service, 'find_orphaned_database_records', return_value=_async_iter([mock_storage_file])):
             result = await cleanup_service.cleanup_orphaned_database_records(dry_run=True)
 
             assert result["records_found"] == 1
@@ -233,7 +411,7 @@ class TestStorageCleanupService:
 
     async def test_cleanup_orphaned_database_records_actual_cleanup(self, cleanup_service, mock_storage_file, mock_db_session):
         """Test actual orphaned database record cleanup."""
-        with patch.object(cleanup_service, 'find_orphaned_database_records', return_value=[mock_storage_file]):
+        with patch.object(cleanup_service, 'find_orphaned_database_records', return_value=_async_iter([mock_storage_file])):
             result = await cleanup_service.cleanup_orphaned_database_records(dry_run=False)
 
             assert result["records_found"] == 1
@@ -241,15 +419,19 @@ class TestStorageCleanupService:
             assert result["records_failed"] == 0
             assert result["errors"] == []
 
-            # Verify record was soft deleted and committed
-            mock_storage_file.soft_delete.assert_called_once()
+            # Verify a single bulk UPDATE covered the record and was committed
+            mock_db_session.execute.assert_awaited_once()
+            stmt, params = mock_db_session.execute.await_args.args
+            assert stmt.is_update
+            assert params == {"ids": [mock_storage_file.id]}
+            mock_storage_file.soft_delete.assert_not_called()
             mock_db_session.commit.assert_called_once()
 
-    async def test_cleanup_orphaned_database_records_with_errors(self, cleanup_service, mock_storage_file):
+    async def test_cleanup_orphaned_database_records_with_errors(self, cleanup_service, mock_storage_file, mock_db_session):
         """Test orphaned database record cleanup with errors."""
-        mock_storage_file.soft_delete.side_effect = Exception("Database error")
+        mock_db_session.execute.side_effect = Exception("Database error")
 
-        with patch.object(cleanup_service, 'find_orphaned_database_records', return_value=[mock_storage_file]):
+        with patch.object(cleanup_service, 'find_orphaned_database_records', return_value=_async_iter([mock_storage_file])):
             result = await cleanup_service.cleanup_orphaned_database_records(dry_run=False)
 
             assert result["records_found"] == 1
@@ -257,8 +439,10 @@ class TestStorageCleanupService:
             assert result["records_failed"] == 1
             assert len(result["errors"]) == 1
             assert "Database error" in result["errors"][0]
+            mock_db_session.rollback.assert_awaited_once()
+            mock_db_session.commit.assert_not_called()
 
-    async def test_cleanup_soft_deleted_files_dry_run(self, cleanup_service, mock_db_session):
+    async def test_cleanup_soft_deleted_files_dry_run(self, cleanup_service, mock_db_session, tmp_path):
         """Test soft-deleted file cleanup in dry run mode."""
         # Mock soft-deleted file
         mock_file = Mock(spec=StorageFile)
@@ -267,31 +451,29 @@ class TestStorageCleanupService:
         mock_file.deleted_at = datetime.now() - timedelta(days=31)
 
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = [mock_file]
+        mock_result.all.return_value = [(mock_file.id, mock_file.file_path)]
         mock_db_session.execute.return_value = mock_result
 
-        # Mock file exists on disk
-        with patch.object(cleanup_service.storage_path, '__truediv__') as mock_div:
-            mock_file_path = Mock()
-            mock_file_path.exists.return_value = True
-            mock_file_path.stat.return_value.st_size = 1024
-            mock_file_path.__str__ = lambda: "/tmp/test_storage/test/file.txt"
-            mock_div.return_value = mock_file_path
+        # File exists on disk
+        cleanup_service.storage_path = tmp_path
+        file_path = tmp_path / "test" / "file.txt"
+        file_path.parent.mkdir()
+        file_path.write_bytes(b"x" * 1024)
 
-            result = await cleanup_service.cleanup_soft_deleted_files(dry_run=True)
+        result = await cleanup_service.cleanup_soft_deleted_files(dry_run=True)
 
-            assert result["files_found"] == 1
-            assert result["files_deleted"] == 0
-            assert result["records_deleted"] == 0
-            assert result["files_failed"] == 0
-            assert result["bytes_freed"] == 1024
-            assert result["errors"] == []
+        assert result["files_found"] == 1
+        assert result["files_deleted"] == 0
+        assert result["records_deleted"] == 0
+        assert result["files_failed"] == 0
+        assert result["bytes_freed"] == 1024
+        assert result["errors"] == []
 
-            # Verify nothing was actually deleted
-            mock_file_path.unlink.assert_not_called()
-            mock_db_session.delete.assert_not_called()
+        # Verify nothing was actually deleted
+        assert file_path.exists()
+        mock_db_session.execute.assert_awaited_once()
 
-    async def test_cleanup_soft_deleted_files_actual_cleanup(self, cleanup_service, mock_db_session):
+    async def test_cleanup_soft_deleted_files_actual_cleanup(self, cleanup_service, mock_db_session, tmp_path):
         """Test actual soft-deleted file cleanup."""
         # Mock soft-deleted file
         mock_file = Mock(spec=StorageFile)
@@ -300,32 +482,37 @@ class TestStorageCleanupService:
         mock_file.deleted_at = datetime.now() - timedelta(days=31)
 
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = [mock_file]
+        mock_result.all.return_value = [(mock_file.id, mock_file.file_path)]
         mock_db_session.execute.return_value = mock_result
 
-        # Mock file exists on disk
-        with patch.object(cleanup_service.storage_path, '__truediv__') as mock_div:
-            mock_file_path = Mock()
-            mock_file_path.exists.return_value = True
-            mock_file_path.stat.return_value.st_size = 1024
-            mock_file_path.__str__ = lambda: "/tmp/test_storage/test/file.txt"
-            mock_div.return_value = mock_file_path
-
-            result = await cleanup_service.cleanup_soft_deleted_files(dry_run=False)
-
-            assert result["files_found"] == 1
-            assert result["files_deleted"] == 1
-            assert result["records_deleted"] == 1
-            assert result["files_failed"] == 0
-            assert result["bytes_freed"] == 1024
-            assert result["errors"] == []
-
-            # Verify file and record were deleted
-            mock_file_path.unlink.assert_called_once()
-            mock_db_session.delete.assert_called_once_with(mock_file)
-            mock_db_session.commit.assert_called_once()
+        # File exists on disk
+        cleanup_service.storage_path = tmp_path
+        file_path = tmp_path / "test" / "file.txt"
+        file_path.parent.mkdir()
+        file_path.write_bytes(b"x" * 1024)
+
+        result = await cleanup_service.cleanup_soft_deleted_files(dry_run=False)
+
+        assert result["files_found"] == 1
+        assert result["files_deleted"] == 1
+        assert result["records_deleted"] == 1
+        assert result["files_failed"] == 0
+        assert result["bytes_freed"] == 1024
+        assert result["errors"] == []
+
+        # Verify file and record were deleted
+        assert not file_path.exists()
+        # One bulk DELETE replaces per-record session.delete() calls
+        delete_calls = [
+            call.args for call in mock_db_session.execute.await_args_list
+            if getattr(call.args[0], "is_delete", False)
+        ]
+        assert len(delete_calls) == 1
+        assert delete_calls[0][1] == {"ids": [mock_file.id]}
+        mock_db_session.delete.assert_not_called()
+        mock_db_session.commit.assert_called_once()
 
-    async def test_cleanup_soft_deleted_files_no_physical_file(self, cleanup_service, mock_db_session):
+    async def test_cleanup_soft_deleted_files_no_physical_file(self, cleanup_service, mock_db_session, tmp_path):
         """Test soft-deleted file cleanup when physical file doesn't exist."""
         # Mock soft-deleted file
         mock_file = Mock(spec=StorageFile)
@@ -334,39 +521,71 @@ class TestStorageCleanupService:
         mock_file.deleted_at = datetime.now() - timedelta(days=31)
 
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = [mock_file]
+        mock_result.all.return_value = [(mock_file.id, mock_file.file_path)]
         mock_db_session.execute.return_value = mock_result
 
-        # Mock file doesn't exist on disk
-        with patch.object(cleanup_service.storage_path, '__truediv__') as mock_div:
-            mock_file_path = Mock()
-            mock_file_path.exists.return_value = False
-            mock_div.return_value = mock_file_path
+        # File doesn't exist on disk
+        cleanup_service.storage_path = tmp_path
 
-            result = await cleanup_service.cleanup_soft_deleted_files(dry_run=False)
+        result = await cleanup_service.cleanup_soft_deleted_files(dry_run=False)
 
-            assert result["files_found"] == 1
-            assert result["files_deleted"] == 0
-            assert result["records_deleted"] == 1
-            assert result["files_failed"] == 0
-            assert result["bytes_freed"] == 0
-            assert result["errors"] == []
+        assert result["files_found"] == 1
+        assert result["files_deleted"] == 0
+        assert result["records_deleted"] == 1
+        assert result["files_failed"] == 0
+        assert result["bytes_freed"] == 0
+        assert result["errors"] == []
+
+        # Verify only record was deleted
+        assert mock_db_session.execute.await_count == 2
+        assert mock_db_session.execute.await_args_list[-1].args[0].is_delete
+
+    async def test_cleanup_soft_deleted_files_batches_commit(self, cleanup_service, mock_db_session, tmp_path):
+        """Test soft-deleted files are purged in batches with a commit per batch."""
+        cleanup_service.storage_path = tmp_path
+        candidates = [(UUID(int=i), f"missing/file{i}.txt") for i in range(2500)]
+
+        result = await cleanup_service.cleanup_soft_deleted_files(dry_run=False, candidates=candidates)
 
-            # Verify only record was deleted
-            mock_file_path.unlink.assert_not_called()
-            mock_db_session.delete.assert_called_once_with(mock_file)
+        assert result["files_found"] == 2500
+        assert result["records_deleted"] == 2500
+        assert result["files_failed"] == 0
 
-    async def test_get_storage_stats_success(self, cleanup_service, mock_db_session):
+        # 1000 + 1000 + 500: one DELETE and one commit per batch
+        batch_sizes = [len(call.args[1]["ids"]) for call in mock_db_session.execute.await_args_list]
+        assert batch_sizes == [1000, 1000, 500]
+        assert mock_db_session.commit.await_count == 3
+
+    async def test_cleanup_soft_deleted_files_pages_after_candidates(self, cleanup_service, mock_db_session, tmp_path):
+        """Test a full candidate batch is followed by keyset pages until a short page."""
+        cleanup_service.storage_path = tmp_path
+        candidates = [(UUID(int=i), f"missing/file{i}.txt") for i in range(1, 1001)]
+        next_page = [(UUID(int=i), f"missing/file{i}.txt") for i in range(1001, 1501)]
+
+        page_result = Mock()
+        page_result.all.return_value = next_page
+        mock_db_session.execute.return_value = page_result
+
+        result = await cleanup_service.cleanup_soft_deleted_files(dry_run=True, candidates=candidates)
+
+        assert result["files_found"] == 1500
+        # Dry run: the only query is the page after the last handed-in candidate
+        mock_db_session.execute.assert_awaited_once()
+        params = mock_db_session.execute.await_args.args[1]
+        assert params["after"] == UUID(int=1000)
+
+    async def test_get_storage_stats_success(self, cleanup_service, mock_db_session, tmp_path):
         """Test successful storage statistics retrieval."""
+        cleanup_service.storage_path = tmp_path
+
         # Mock database query result
         mock_result = Mock()
-        mock_result.fetchone.return_value = (100, 80, 20, 1024000, 1280000)  # total, active, deleted, active_size, total_size
+        # total, active, deleted, active_size, total_size, expired_ids, expired_paths
+        mock_result.fetchone.return_value = (100, 80, 20, 1024000, 1280000, None, None)
         mock_db_session.execute.return_value = mock_result
 
         # Mock disk usage
-        with patch('shutil.disk_usage', return_value=(10000000, 5000000, 5000000)), \
-             patch.object(cleanup_service.storage_path, 'exists', return_value=True):
-
+        with patch('shutil.disk_usage', return_value=(10000000, 5000000, 5000000)):
             result = await cleanup_service.get_storage_stats()
 
             assert result["database"]["total_files"] == 100
@@ -379,31 +598,32 @@ class TestStorageCleanupService:
             assert result["disk"]["free"] == 5000000
             assert result["storage_path"] == str(cleanup_service.storage_path)
 
-    async def test_get_storage_stats_no_storage_path(self, cleanup_service, mock_db_session):
+    async def test_get_storage_stats_no_storage_path(self, cleanup_service, mock_db_session, tmp_path):
         """Test storage statistics when storage path doesn't exist."""
+        cleanup_service.storage_path = tmp_path / "missing"
+
         # Mock database query result
         mock_result = Mock()
-        mock_result.fetchone.return_value = (0, 0, 0, 0, 0)
+        mock_result.fetchone.return_value = (0, 0, 0, 0, 0, None, None)
         mock_db_session.execute.return_value = mock_result
 
-        with patch.object(cleanup_service.storage_path, 'exists', return_value=False):
-            result = await cleanup_service.get_storage_stats()
+        result = await cleanup_service.get_storage_stats()
 
-            assert result["database"]["total_files"] == 0
-            assert result["disk"]["total"] == 0
-            assert result["disk"]["used"] == 0
-            assert result["disk"]["free"] == 0
+        assert result["database"]["total_files"] == 0
+        assert result["disk"]["total"] == 0
+        assert result["disk"]["used"] == 0
+        assert result["disk"]["free"] == 0
 
-    async def test_get_storage_stats_disk_usage_error(self, cleanup_service, mock_db_session):
+    async def test_get_storage_stats_disk_usage_error(self, cleanup_service, mock_db_session, tmp_path):
         """Test storage statistics when disk usage fails."""
+        cleanup_service.storage_path = tmp_path
+
         # Mock database query result
         mock_result = Mock()
-        mock_result.fetchone.return_value = (10, 8, 2, 1024, 1280)
+        mock_result.fetchone.return_value = (10, 8, 2, 1024, 1280, None, None)
         mock_db_session.execute.return_value = mock_result
 
-        with patch('shutil.disk_usage', side_effect=OSError("Permission denied")), \
-             patch.object(cleanup_service.storage_path, 'exists', return_value=True):
-
+        with patch('shutil.disk_usage', side_effect=OSError("Permission denied")):
             result = await cleanup_service.get_storage_stats()
 
             assert result["database"]["total_files"] == 10
@@ -411,6 +631,35 @@ class TestStorageCleanupService:
             assert result["disk"]["used"] == 0
             assert result["disk"]["free"] == 0
 
+    async def test_stats_and_candidates_single_query(self, cleanup_service, mock_db_session, tmp_path):
+        """Test stats and soft-deleted candidates come from one query and feed the cleanup."""
+        cleanup_service.storage_path = tmp_path
+        expired_id = UUID("22222222-2222-2222-2222-222222222222")
+
+        mock_result = Mock()
+        mock_result.fetchone.return_value = (3, 2, 1, 2048, 3072, [expired_id], ["old/file.txt"])
+        mock_db_session.execute.return_value = mock_result
+
+        stats, candidates = await cleanup_service.get_storage_stats_and_candidates(older_than_days=30)
+
+        assert stats["database"]["total_files"] == 3
+        assert stats["database"]["deleted_files"] == 1
+        assert candidates == [(expired_id, "old/file.txt")]
+
+        mock_db_session.execute.assert_awaited_once()
+        sql = str(mock_db_session.execute.await_args.args[0])
+        # Each total filters on a partial index predicate
+        assert "WHERE storage_files.deleted_at IS NULL" in sql
+        assert "WHERE storage_files.deleted_at IS NOT NULL" in sql
+        assert "array_agg" in sql
+        assert "LIMIT" in sql
+
+        # Handing the candidates over skips the separate soft-deleted lookup
+        result = await cleanup_service.cleanup_soft_deleted_files(dry_run=True, candidates=candidates)
+
+        assert result["files_found"] == 1
+        mock_db_session.execute.assert_awaited_once()
+
 
 @pytest.mark.asyncio
 class TestRunCleanupJob:
@@ -420,16 +669,18 @@ class TestRunCleanupJob:
         """Test running cleanup job in dry run mode."""
         mock_cleanup_service = Mock()
         mock_cleanup_service.get_storage_stats = AsyncMock(return_value={"test": "stats"})
+        mock_cleanup_service.get_storage_stats_and_candidates = AsyncMock(return_value=({"test": "stats"}, []))
         mock_cleanup_service.cleanup_orphaned_files = AsyncMock(return_value={"files_deleted": 0, "bytes_freed": 1024})
         mock_cleanup_service.cleanup_orphaned_database_records = AsyncMock(return_value={"records_deleted": 0})
         mock_cleanup_service.cleanup_soft_deleted_files = AsyncMock(return_value={"files_deleted": 0, "records_deleted": 0, "bytes_freed": 2048})
 
-        with patch('app.modules.storage.cleanup.get_db_session') as mock_get_db, \
+        with patch('app.modules.storage.cleanup.db_manager') as mock_db_manager, \
+             patch('app.modules.storage.cleanup._load_active_path_filter', AsyncMock(return_value=frozenset())), \
              patch('app.modules.storage.cleanup.StorageCleanupService', return_value=mock_cleanup_service):
 
             mock_db = Mock()
-            mock_get_db.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_get_db.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_db_manager.session_factory.return_value.__aenter__ = AsyncMock(return_value=mock_db)
+            mock_db_manager.session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
 
             result = await run_cleanup_job(dry_run=True)
 
@@ -441,24 +692,28 @@ class TestRunCleanupJob:
             assert result["soft_deleted"]["files_deleted"] == 0
 
             # Verify all cleanup methods were called
-            mock_cleanup_service.cleanup_orphaned_files.assert_called_once_with(True)
+            mock_cleanup_service.cleanup_orphaned_files.assert_called_once_with(True, active_paths=frozenset())
             mock_cleanup_service.cleanup_orphaned_database_records.assert_called_once_with(True)
-            mock_cleanup_service.cleanup_soft_deleted_files.assert_called_once_with(older_than_days=30, dry_run=True)
+            mock_cleanup_service.cleanup_soft_deleted_files.assert_called_once_with(
+                older_than_days=30, dry_run=True, candidates=[]
+            )
 
     async def test_run_cleanup_job_actual_cleanup(self):
         """Test running actual cleanup job."""
         mock_cleanup_service = Mock()
         mock_cleanup_service.get_storage_stats = AsyncMock(return_value={"test": "stats"})
+        mock_cleanup_service.get_storage_stats_and_candidates = AsyncMock(return_value=({"test": "stats"}, []))
         mock_cleanup_service.cleanup_orphaned_files = AsyncMock(return_value={"files_deleted": 5, "bytes_freed": 1024})
         mock_cleanup_service.cleanup_orphaned_database_records = AsyncMock(return_value={"records_deleted": 3})
         mock_cleanup_service.cleanup_soft_deleted_files = AsyncMock(return_value={"files_deleted": 2, "records_deleted": 2, "bytes_freed": 2048})
 
-        with patch('app.modules.storage.cleanup.get_db_session') as mock_get_db, \
+        with patch('app.modules.storage.cleanup.db_manager') as mock_db_manager, \
+             patch('app.modules.storage.cleanup._load_active_path_filter', AsyncMock(return_value=frozenset())), \
              patch('app.modules.storage.cleanup.StorageCleanupService', return_value=mock_cleanup_service):
 
             mock_db = Mock()
-            mock_get_db.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_get_db.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_db_manager.session_factory.return_value.__aenter__ = AsyncMock(return_value=mock_db)
+            mock_db_manager.session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
 
             result = await run_cleanup_job(dry_run=False)
 
@@ -468,22 +723,33 @@ class TestRunCleanupJob:
             assert result["soft_deleted"]["files_deleted"] == 2
 
             # Verify all cleanup methods were called
-            mock_cleanup_service.cleanup_orphaned_files.assert_called_once_with(False)
+            mock_cleanup_service.cleanup_orphaned_files.assert_called_once_with(False, active_paths=frozenset())
             mock_cleanup_service.cleanup_orphaned_database_records.assert_called_once_with(False)
-            mock_cleanup_service.cleanup_soft_deleted_files.assert_called_once_with(older_than_days=30, dry_run=False)
+            mock_cleanup_service.cleanup_soft_deleted_files.assert_called_once_with(
+                older_than_days=30, dry_run=False, candidates=[]
+            )
+
+            # Stats before, three phases, stats after: one session each
+            assert mock_db_manager.session_factory.call_count == 5
+
+            # Soft-deleted files are purged before the orphan scan starts
+            call_order = [name for name, _, _ in mock_cleanup_service.method_calls]
+            assert call_order.index("cleanup_soft_deleted_files") < call_order.index("cleanup_orphaned_files")
 
     async def test_run_cleanup_job_selective_cleanup(self):
         """Test running cleanup job with selective operations."""
         mock_cleanup_service = Mock()
         mock_cleanup_service.get_storage_stats = AsyncMock(return_value={"test": "stats"})
+        mock_cleanup_service.get_storage_stats_and_candidates = AsyncMock(return_value=({"test": "stats"}, []))
         mock_cleanup_service.cleanup_orphaned_files = AsyncMock(return_value={"files_deleted": 0, "bytes_freed": 0})
 
-        with patch('app.modules.storage.cleanup.get_db_session') as mock_get_db, \
+        with patch('app.modules.storage.cleanup.db_manager') as mock_db_manager, \
+             patch('app.modules.storage.cleanup._load_active_path_filter', AsyncMock(return_value=frozenset())), \
              patch('app.modules.storage.cleanup.StorageCleanupService', return_value=mock_cleanup_service):
 
             mock_db = Mock()
-            mock_get_db.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_get_db.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_db_manager.session_factory.return_value.__aenter__ = AsyncMock(return_value=mock_db)
+            mock_db_manager.session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
 
             result = await run_cleanup_job(
                 dry_run=True,
@@ -496,7 +762,43 @@ class TestRunCleanupJob:
             assert result["orphaned_records"] == {}
             assert result["soft_deleted"] == {}
 
-            # Verify only orphaned files cleanup was called
+            # Skipped phases return early without opening a session
+            assert mock_db_manager.session_factory.call_count == 3
             mock_cleanup_service.cleanup_orphaned_files.assert_called_once()
             mock_cleanup_service.cleanup_orphaned_database_records.assert_not_called()
             mock_cleanup_service.cleanup_soft_deleted_files.assert_not_called()
+
+            # Without the soft-deleted phase no cleanup candidates are selected
+            mock_cleanup_service.get_storage_stats_and_candidates.assert_not_called()
+            assert mock_cleanup_service.get_storage_stats.await_count == 2
+
+    async def test_run_cleanup_job_real_session_factory(self):
+        """Test every phase opens a real AsyncSession through the session factory."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        session_factory = async_sessionmaker(bind=engine, class_=AsyncSession)
+
+        services = []
+
+        def build_service(db):
+            service = Mock(db=db)
+            service.get_storage_stats = AsyncMock(return_value={})
+            service.get_storage_stats_and_candidates = AsyncMock(return_value=({}, []))
+            service.cleanup_orphaned_files = AsyncMock(return_value={})
+            service.cleanup_orphaned_database_records = AsyncMock(return_value={})
+            service.cleanup_soft_deleted_files = AsyncMock(return_value={})
+            services.append(service)
+            return service
+
+        try:
+            with patch.object(db_manager, "_session_factory", session_factory), \
+                 patch('app.modules.storage.cleanup._load_active_path_filter',
+                       AsyncMock(return_value=frozenset())), \
+                 patch('app.modules.storage.cleanup.StorageCleanupService', side_effect=build_service):
+                result = await run_cleanup_job(dry_run=True)
+        finally:
+            await engine.dispose()
+
+        assert "completed_at" in result
+        # Stats before, three phases, stats after
+        assert len(services) == 5
+        assert all(isinstance(service.db, AsyncSession) for service in services)
@@ -0,0 +1,38 @@
+"""
+Unit tests for CommonValidators.validate_email.
+"""
+
+import pytest
+from app.core.validators import CommonValidators
+
+
+class TestValidateEmail:
+    """Test cases for email validation."""
+
+    def test_validate_email_success(self):
+        """Test successful email validation."""
+        valid_emails = [
+            ("Test@Example.com", "test@example.com"),
+            ("  user@domain.org  ", "user@domain.org"),
+            ("name.surname@company.co.uk", "name.surname@company.co.uk"),
+        ]
+
+        for input_val, expected in valid_emails:
+            result = CommonValidators.validate_email(input_val)
+            assert result == expected
+
+    def test_validate_email_empty(self):
+        """Test email validation with empty input."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_email("")
+        assert "Email cannot be empty" in str(exc_info.value)
+
+    def test_validate_email_disposable(self, monkeypatch):
+        """Test email validation with disposable domains."""
+        monkeypatch.setattr(
+            'app.core.validators.ReservedNames.DISPOSABLE_EMAIL_DOMAINS', {"tempmail.com", "10minutemail.com"}
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_email("user@tempmail.com")
+        assert "Disposable email addresses are not allowed" in str(exc_info.value)
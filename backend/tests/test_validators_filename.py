@@ -0,0 +1,59 @@
+"""
+Unit tests for CommonValidators.validate_filename.
+"""
+
+import pytest
+from app.core.validators import CommonValidators
+from validator_samples import INVALID_FILENAME_CHARS
+
+
+# One character over the 255 limit once the extension is added
+_LONG_FILENAME = "a" * 256 + ".txt"
+
+
+class TestValidateFilename:
+    """Test cases for filename validation."""
+
+    def test_validate_filename_success(self):
+        """Test successful filename validation."""
+        valid_filenames = [
+            "document.txt",
+            "my_file.pdf",
+            "image-2023.jpg",
+        ]
+
+        for filename in valid_filenames:
+            result = CommonValidators.validate_filename(filename)
+            assert result == filename
+
+    def test_validate_filename_empty(self):
+        """Test filename validation with empty input."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_filename("")
+        assert "Filename cannot be empty" in str(exc_info.value)
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_filename("   ")
+        assert "Filename cannot be empty" in str(exc_info.value)
+
+    def test_validate_filename_too_long(self):
+        """Test filename validation with too long name."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_filename(_LONG_FILENAME)
+        assert "Filename cannot exceed 255 characters" in str(exc_info.value)
+
+    @pytest.mark.parametrize("filename", INVALID_FILENAME_CHARS, ids=repr)
+    def test_validate_filename_invalid_characters(self, filename):
+        """Test filename validation with invalid characters."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_filename(filename)
+        assert "Filename contains invalid characters" in str(exc_info.value)
+
+    def test_validate_filename_reserved_names(self):
+        """Test filename validation with reserved names."""
+        reserved_names = ["CON.txt", "PRN.doc", "AUX.pdf", "NUL", "COM1.exe", "LPT1.dat"]
+
+        for filename in reserved_names:
+            with pytest.raises(ValueError) as exc_info:
+                CommonValidators.validate_filename(filename)
+            assert "uses a reserved name" in str(exc_info.value)
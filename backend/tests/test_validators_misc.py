@@ -0,0 +1,184 @@
+"""
+Unit tests for CommonValidators hex color, phone number, positive integer,
+future datetime and UUID list validation.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from app.core.validators import CommonValidators
+
+
+# UUIDs shared by the UUID list tests
+_UUID_A = uuid4()
+_UUID_B = uuid4()
+
+
+@pytest.fixture(scope="module")
+def frozen_now():
+    """Freeze ``datetime.utcnow()`` as seen by the validators module for this module's tests."""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return now
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('app.core.validators.datetime', FrozenDatetime)
+        yield now
+
+
+@pytest.fixture(scope="module")
+def future(frozen_now):
+    """One day after the frozen clock."""
+    return frozen_now + timedelta(days=1)
+
+
+@pytest.fixture(scope="module")
+def past(frozen_now):
+    """One day before the frozen clock."""
+    return frozen_now - timedelta(days=1)
+
+
+class TestCommonValidatorsMisc:
+    """Test cases for the remaining CommonValidators checks."""
+
+    def test_validate_hex_color_success(self):
+        """Test successful hex color validation."""
+        valid_colors = [
+            ("#FF0000", "#FF0000"),
+            ("#fff", "#FFF"),
+            ("  #abc123  ", "#ABC123"),
+        ]
+
+        for input_val, expected in valid_colors:
+            result = CommonValidators.validate_hex_color(input_val)
+            assert result == expected
+
+    def test_validate_hex_color_empty(self):
+        """Test hex color validation with empty input."""
+        result = CommonValidators.validate_hex_color("")
+        assert result == ""
+
+    def test_validate_hex_color_invalid(self):
+        """Test hex color validation with invalid format."""
+        invalid_colors = [
+            "FF0000",    # no hash
+            "#GG0000",   # invalid character
+            "#FF00",     # wrong length
+        ]
+
+        for color in invalid_colors:
+            with pytest.raises(ValueError) as exc_info:
+                CommonValidators.validate_hex_color(color)
+            assert "Invalid hex color format" in str(exc_info.value)
+
+    def test_validate_phone_number_success(self):
+        """Test successful phone number validation."""
+        valid_phones = [
+            ("+1 (555) 123-4567", "+15551234567"),
+            ("555-123-4567", "5551234567"),
+            ("+44 20 7946 0958", "+442079460958"),
+        ]
+
+        for input_val, expected in valid_phones:
+            result = CommonValidators.validate_phone_number(input_val)
+            assert result == expected
+
+    def test_validate_phone_number_empty(self):
+        """Test phone number validation with empty input."""
+        result = CommonValidators.validate_phone_number("")
+        assert result == ""
+
+    def test_validate_phone_number_invalid(self):
+        """Test phone number validation with invalid format."""
+        invalid_phones = [
+            "123456",           # too short
+            "+0123456789",      # starts with 0
+            "abc1234567",       # letters
+        ]
+
+        for phone in invalid_phones:
+            with pytest.raises(ValueError) as exc_info:
+                CommonValidators.validate_phone_number(phone)
+            assert "Invalid phone number format" in str(exc_info.value)
+
+    def test_validate_positive_integer_success(self):
+        """Test successful positive integer validation."""
+        valid_integers = [1, 42, 1000, 999999]
+
+        for value in valid_integers:
+            result = CommonValidators.validate_positive_integer(value)
+            assert result == value
+
+    def test_validate_positive_integer_none(self):
+        """Test positive integer validation with None."""
+        result = CommonValidators.validate_positive_integer(None)
+        assert result is None
+
+    def test_validate_positive_integer_not_integer(self):
+        """Test positive integer validation with non-integer."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_positive_integer("123")
+        assert "Value must be an integer" in str(exc_info.value)
+
+    def test_validate_positive_integer_not_positive(self):
+        """Test positive integer validation with non-positive value."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_positive_integer(0)
+        assert "Value must be positive" in str(exc_info.value)
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_positive_integer(-5)
+        assert "Value must be positive" in str(exc_info.value)
+
+    def test_validate_future_datetime_success(self, future):
+        """Test successful future datetime validation."""
+        result = CommonValidators.validate_future_datetime(future)
+        assert result == future
+
+    def test_validate_future_datetime_none(self):
+        """Test future datetime validation with None."""
+        result = CommonValidators.validate_future_datetime(None)
+        assert result is None
+
+    def test_validate_future_datetime_past(self, past):
+        """Test future datetime validation with past date."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_future_datetime(past)
+        assert "Date must be in the future" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            pytest.param([_UUID_A, _UUID_B], id="uuid-objects"),
+            pytest.param([str(_UUID_A), str(_UUID_B)], id="uuid-strings"),
+            pytest.param([_UUID_A, str(_UUID_B)], id="mixed"),
+        ],
+    )
+    def test_validate_uuid_list_success(self, values):
+        """Test successful UUID list validation."""
+        result = CommonValidators.validate_uuid_list(values)
+        assert result == [_UUID_A, _UUID_B]
+
+    def test_validate_uuid_list_empty(self):
+        """Test UUID list validation with empty list."""
+        result = CommonValidators.validate_uuid_list([])
+        assert result == []
+
+        result = CommonValidators.validate_uuid_list(None)
+        assert result == []
+
+    def test_validate_uuid_list_invalid_string(self):
+        """Test UUID list validation with invalid string UUID."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_uuid_list(["not-a-uuid"])
+        assert "Invalid UUID format" in str(exc_info.value)
+
+    def test_validate_uuid_list_invalid_type(self):
+        """Test UUID list validation with invalid type."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_uuid_list([123])
+        assert "Invalid UUID type" in str(exc_info.value)
@@ -0,0 +1,70 @@
+"""
+Unit tests for CommonValidators.validate_strong_password.
+"""
+
+import pytest
+from app.core.validators import CommonValidators
+
+
+# Longer than the patched MAX_PASSWORD_LENGTH of 20
+_LONG_PASSWORD = "A" * 21 + "1!"
+
+
+class TestValidateStrongPassword:
+    """Test cases for strong password validation."""
+
+    def test_validate_strong_password_success(self):
+        """Test successful strong password validation."""
+        valid_passwords = [
+            "Password123!",
+            "MyStr0ng@Pass",
+            "C0mplex$Pass",
+        ]
+
+        for password in valid_passwords:
+            result = CommonValidators.validate_strong_password(password)
+            assert result == password
+
+    def test_validate_strong_password_empty(self):
+        """Test strong password validation with empty input."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_strong_password("")
+        assert "Password cannot be empty" in str(exc_info.value)
+
+    def test_validate_strong_password_too_short(self, monkeypatch):
+        """Test strong password validation with too short password."""
+        monkeypatch.setattr('app.core.validators.validation_config.MIN_PASSWORD_LENGTH', 8)
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_strong_password("Pass1!")
+        assert "Password must be at least" in str(exc_info.value)
+
+    def test_validate_strong_password_too_long(self, monkeypatch):
+        """Test strong password validation with too long password."""
+        monkeypatch.setattr('app.core.validators.validation_config.MAX_PASSWORD_LENGTH', 20)
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_strong_password(_LONG_PASSWORD)
+        assert "Password cannot exceed" in str(exc_info.value)
+
+    def test_validate_strong_password_common(self, monkeypatch):
+        """Test strong password validation with common passwords."""
+        monkeypatch.setattr('app.core.validators.WeakPasswords.COMMON_PASSWORDS', {"password123", "123456789"})
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_strong_password("Password123")
+        assert "Password is too common" in str(exc_info.value)
+
+    def test_validate_strong_password_requirements(self):
+        """Test strong password validation with missing requirements."""
+        test_cases = [
+            ("password123!", "uppercase"),  # no uppercase
+            ("PASSWORD123!", "lowercase"),  # no lowercase
+            ("Password!", "digit"),         # no digit
+            ("Password123", "special"),     # no special
+        ]
+
+        for password, missing in test_cases:
+            with pytest.raises(ValueError) as exc_info:
+                CommonValidators.validate_strong_password(password)
+            assert "Password must contain" in str(exc_info.value)
@@ -0,0 +1,67 @@
+"""
+Unit tests for CommonValidators.validate_url.
+"""
+
+import pytest
+from app.core.validators import CommonValidators
+
+
+class TestValidateUrl:
+    """Test cases for URL validation."""
+
+    def test_validate_url_success(self):
+        """Test successful URL validation."""
+        valid_urls = [
+            "https://example.com",
+            "http://subdomain.example.org/path",
+            "https://api.service.com/v1/endpoint",
+        ]
+
+        for url in valid_urls:
+            result = CommonValidators.validate_url(url)
+            assert result == url
+
+    def test_validate_url_empty(self):
+        """Test URL validation with empty input."""
+        result = CommonValidators.validate_url("")
+        assert result == ""
+
+        result = CommonValidators.validate_url(None)
+        assert result is None
+
+    def test_validate_url_invalid_format(self):
+        """Test URL validation with invalid format."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_url("not-a-url")
+        assert "Invalid URL format" in str(exc_info.value)
+
+    def test_validate_url_no_protocol(self):
+        """Test URL validation without protocol."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_url("example.com")
+        assert "URL must include protocol" in str(exc_info.value)
+
+    def test_validate_url_invalid_protocol(self):
+        """Test URL validation with invalid protocol."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_url("ftp://example.com")
+        assert "URL must use HTTP or HTTPS protocol" in str(exc_info.value)
+
+    def test_validate_url_no_domain(self):
+        """Test URL validation without domain."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_url("https://")
+        assert "URL must include domain" in str(exc_info.value)
+
+    def test_validate_url_localhost(self):
+        """Test URL validation with localhost."""
+        localhost_urls = [
+            "http://localhost:8000",
+            "https://127.0.0.1:3000",
+            "http://0.0.0.0:5000",
+        ]
+
+        for url in localhost_urls:
+            with pytest.raises(ValueError) as exc_info:
+                CommonValidators.validate_url(url)
+            assert "Localhost URLs are not allowed" in str(exc_info.value)
@@ -0,0 +1,56 @@
+"""
+Unit tests for CommonValidators.validate_username.
+"""
+
+import pytest
+from app.core.validators import CommonValidators
+from validator_samples import USERNAME_TOO_LONG
+
+
+class TestValidateUsername:
+    """Test cases for username validation."""
+
+    def test_validate_username_success(self):
+        """Test successful username validation."""
+        valid_cases = [
+            ("TestUser", "testuser"),
+            ("user_123", "user_123"),
+            ("my-name", "my-name"),
+            ("  SpacedUser  ", "spaceduser"),
+        ]
+
+        for input_val, expected in valid_cases:
+            result = CommonValidators.validate_username(input_val)
+            assert result == expected
+
+    def test_validate_username_empty(self):
+        """Test username validation with empty input."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_username("")
+        assert "Username cannot be empty" in str(exc_info.value)
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_username(None)
+        assert "Username cannot be empty" in str(exc_info.value)
+
+    def test_validate_username_invalid_format(self):
+        """Test username validation with invalid format."""
+        invalid_usernames = [
+            "ab",  # too short
+            USERNAME_TOO_LONG,  # too long
+            "user@domain",  # invalid character
+            "user.name",  # invalid character
+        ]
+
+        for username in invalid_usernames:
+            with pytest.raises(ValueError) as exc_info:
+                CommonValidators.validate_username(username)
+            assert "Username format is invalid" in str(exc_info.value)
+
+    def test_validate_username_reserved(self, monkeypatch):
+        """Test username validation with reserved names."""
+        monkeypatch.setattr('app.core.validators.ReservedNames.USERNAMES', {"admin", "root", "system"})
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_username("admin")
+        assert "Username is reserved" in str(exc_info.value)
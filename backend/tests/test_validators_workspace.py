@@ -0,0 +1,55 @@
+"""
+Unit tests for CommonValidators.validate_workspace_name.
+"""
+
+import pytest
+from app.core.validators import CommonValidators
+
+
+# One character over the 255 limit
+_LONG_NAME = "a" * 256
+
+
+class TestValidateWorkspaceName:
+    """Test cases for workspace name validation."""
+
+    def test_validate_workspace_name_success(self):
+        """Test successful workspace name validation."""
+        valid_names = [
+            "My Workspace",
+            "Project-2023",
+            "Single",
+            "Name_with_underscores",
+        ]
+
+        for name in valid_names:
+            result = CommonValidators.validate_workspace_name(name)
+            assert result == name
+
+    def test_validate_workspace_name_empty(self):
+        """Test workspace name validation with empty input."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_workspace_name("")
+        assert "Name cannot be empty" in str(exc_info.value)
+
+    def test_validate_workspace_name_whitespace_only(self):
+        """Test workspace name validation with whitespace only."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_workspace_name("   ")
+        assert "Name cannot be empty or only whitespace" in str(exc_info.value)
+
+    def test_validate_workspace_name_too_long(self):
+        """Test workspace name validation with too long name."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_workspace_name(_LONG_NAME)
+        assert "Name cannot exceed 255 characters" in str(exc_info.value)
+
+    def test_validate_workspace_name_leading_trailing_spaces(self):
+        """Test workspace name validation with leading/trailing spaces."""
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_workspace_name(" Name")
+        assert "Name cannot have leading or trailing whitespace" in str(exc_info.value)
+
+        with pytest.raises(ValueError) as exc_info:
+            CommonValidators.validate_workspace_name("Name ")
+        assert "Name cannot have leading or trailing whitespace" in str(exc_info.value)
@@ -4,7 +4,7 @@ Unit tests for WorkspaceService.
 This module contains comprehensive tests for workspace management operations.
 """
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 from uuid import uuid4
 
 import pytest
@@ -18,165 +18,242 @@ from app.modules.workspace.models import (
 )
 from app.modules.workspace.schemas import WorkspaceCreate, WorkspaceUpdate
 from app.modules.workspace.service import WorkspaceService
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 
-class TestWorkspaceService:
-    """Test cases for WorkspaceService."""
+# Fixed timestamp for sample objects; no test asserts on it
+_FROZEN_NOW = datetime(2024, 1, 1, 0, 0, 0)
 
-    @pytest.fixture
-    def mock_db(self):
-        """Mock database session."""
-        return AsyncMock(spec=AsyncSession)
+# Identifier of the session-scoped sample user
+_SAMPLE_USER_ID = uuid4()
 
-    @pytest.fixture
-    def workspace_service(self, mock_db):
-        """WorkspaceService instance with mocked database."""
-        return WorkspaceService(db=mock_db)
+# Known-valid request payloads, built once without re-running validation
+_CREATE_PAYLOAD = WorkspaceCreate.model_construct(
+    name="New Workspace",
+    description="A new workspace",
+    is_public=True,
+    max_members=20,
+    avatar_url="https://example.com/avatar.png"
+)
+_CREATE_MINIMAL_PAYLOAD = WorkspaceCreate.model_construct(name="Test Workspace")
+_UPDATE_PAYLOAD = WorkspaceUpdate.model_construct(
+    name="Updated Workspace",
+    description="Updated description",
+    is_public=True
+)
+_PARTIAL_UPDATE_PAYLOAD = WorkspaceUpdate.model_construct(description="New description only")
 
-    @pytest.fixture
-    def sample_user(self):
-        """Sample user for testing."""
-        return User(
-            id=uuid4(),
-            username="testuser",
-            email="test@example.com",
-            is_active=True,
-            created_at=datetime.utcnow()
-        )
 
-    @pytest.fixture
-    def sample_workspace(self, sample_user):
-        """Sample workspace for testing."""
-        return Workspace(
-            id=uuid4(),
-            name="Test Workspace",
-            description="A test workspace",
-            owner_id=sample_user.id,
-            is_public=False,
-            max_members=10,
-            status=WorkspaceStatus.ACTIVE,
-            created_at=datetime.utcnow()
-        )
+class FakeAsyncSession:
+    """Stand-in for ``AsyncSession`` exposing only the methods WorkspaceService uses."""
 
-    @pytest.fixture
-    def sample_role(self):
-        """Sample workspace role for testing."""
-        return WorkspaceRole(
-            id=uuid4(),
-            name=WorkspaceRoleEnum.ADMIN,
-            description="Administrator role",
-            is_system_role=True,
-            permissions=["read", "write", "admin"]
-        )
+    def __init__(self):
+        self._recorder = Mock()
+        for name, method in (
+            ("execute", AsyncMock()),
+            ("add", MagicMock()),
+            ("flush", AsyncMock()),
+            ("commit", AsyncMock()),
+            ("refresh", AsyncMock()),
+            ("delete", AsyncMock()),
+        ):
+            self._recorder.attach_mock(method, name)
+            setattr(self, name, method)
 
-    @pytest.fixture
-    def sample_member(self, sample_workspace, sample_user, sample_role):
-        """Sample workspace member for testing."""
-        return WorkspaceMember(
-            id=uuid4(),
-            workspace_id=sample_workspace.id,
-            user_id=sample_user.id,
-            role_id=sample_role.id,
-            is_active=True,
-            joined_at=datetime.utcnow()
-        )
+    @property
+    def method_calls(self):
+        """Calls made to any of the session methods, in order."""
+        return self._recorder.method_calls
 
-    async def test_create_workspace_success(self, workspace_service, mock_db, sample_user, sample_role):
-        """Test successful workspace creation."""
-        # Arrange
-        workspace_data = WorkspaceCreate(
-            name="New Workspace",
-            description="A new workspace",
-            is_public=True,
-            max_members=20,
-            avatar_url="https://example.com/avatar.png"
-        )
 
-        # Mock role lookup
-        mock_role_result = MagicMock()
-        mock_role_result.scalar_one_or_none.return_value = sample_role
-        mock_db.execute.return_value = mock_role_result
+def _called_methods(session):
+    """Names of the session methods called, in call order."""
+    return [name for name, *_ in session.method_calls]
 
-        # Mock workspace creation
-        created_workspace = Workspace(
-            id=uuid4(),
-            name=workspace_data.name,
-            description=workspace_data.description,
-            owner_id=sample_user.id,
-            is_public=workspace_data.is_public,
-            max_members=workspace_data.max_members,
-            avatar_url=workspace_data.avatar_url,
-            status=WorkspaceStatus.ACTIVE
-        )
 
-        # Act
-        with patch.object(workspace_service, 'get_role_by_name', return_value=sample_role):
-            result = await workspace_service.create_workspace(workspace_data, sample_user)
+class _ScalarResult:
+    """Minimal ``Result`` stand-in for single-value lookups."""
 
-        # Assert
-        mock_db.add.assert_called()
-        mock_db.flush.assert_called_once()
-        mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once()
+    __slots__ = ("_value",)
 
-        # Verify workspace member was added
-        assert mock_db.add.call_count == 2  # Workspace + Member
+    def __init__(self, value):
+        self._value = value
 
-    async def test_create_workspace_no_admin_role(self, workspace_service, mock_db, sample_user):
-        """Test workspace creation when admin role is not found."""
-        # Arrange
-        workspace_data = WorkspaceCreate(name="Test Workspace")
+    def scalar_one_or_none(self):
+        return self._value
 
-        # Act
-        with patch.object(workspace_service, 'get_role_by_name', return_value=None):
-            result = await workspace_service.create_workspace(workspace_data, sample_user)
+    def scalar(self):
+        return self._value
 
-        # Assert
-        mock_db.add.assert_called_once()  # Only workspace, no member
-        mock_db.commit.assert_called_once()
 
-    async def test_get_workspace_by_id_found(self, workspace_service, mock_db, sample_workspace):
-        """Test getting workspace by ID when found."""
+class _ScalarsResult:
+    """Minimal ``Result`` stand-in for ``result.scalars().all()`` lookups."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values):
+        self._values = values
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._values
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return FakeAsyncSession()
+
+
+def _build_workspace(owner_id):
+    """Build the sample workspace owned by ``owner_id``."""
+    return Workspace(
+        id=uuid4(),
+        name="Test Workspace",
+        description="A test workspace",
+        owner_id=owner_id,
+        is_public=False,
+        max_members=10,
+        status=WorkspaceStatus.ACTIVE,
+        created_at=_FROZEN_NOW
+    )
+
+
+def _build_member(workspace, user, role):
+    """Build the sample membership of ``user`` in ``workspace`` with ``role``."""
+    return WorkspaceMember(
+        id=uuid4(),
+        workspace_id=workspace.id,
+        user_id=user.id,
+        role_id=role.id,
+        is_active=True,
+        joined_at=_FROZEN_NOW
+    )
+
+
+# Sample objects that no test mutates are built once per session; tests that
+# change attributes use the function-scoped *_mutable variants instead
+
+
+@pytest.fixture(scope="session")
+def sample_user():
+    """Sample user for testing."""
+    return User(
+        id=_SAMPLE_USER_ID,
+        username="testuser",
+        email="test@example.com",
+        is_active=True,
+        created_at=_FROZEN_NOW
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_role():
+    """Sample workspace role for testing."""
+    return WorkspaceRole(
+        id=uuid4(),
+        name=WorkspaceRoleEnum.ADMIN,
+        description="Administrator role",
+        is_system_role=True,
+        permissions=["read", "write", "admin"]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_workspace_readonly(sample_user):
+    """Sample workspace shared by tests that only read it."""
+    return _build_workspace(sample_user.id)
+
+
+@pytest.fixture
+def sample_workspace_mutable(sample_user):
+    """Fresh sample workspace for tests that modify it."""
+    return _build_workspace(sample_user.id)
+
+
+@pytest.fixture(scope="session")
+def sample_member_readonly(sample_workspace_readonly, sample_user, sample_role):
+    """Sample workspace member shared by tests that only read it."""
+    return _build_member(sample_workspace_readonly, sample_user, sample_role)
+
+
+@pytest.fixture
+def sample_member_mutable(sample_workspace_readonly, sample_user, sample_role):
+    """Fresh sample workspace member for tests that modify it."""
+    return _build_member(sample_workspace_readonly, sample_user, sample_role)
+
+
+class TestWorkspaceService:
+    """Test cases for WorkspaceService."""
+
+    @pytest.fixture
+    def workspace_service(self, mock_db):
+        """WorkspaceService instance with mocked database."""
+        return WorkspaceService(db=mock_db)
+
+    @pytest.fixture
+    def patch_get_role(self, mocker):
+        """Patch WorkspaceService.get_role_by_name and return the mock."""
+        return mocker.patch.object(WorkspaceService, 'get_role_by_name', new_callable=AsyncMock)
+
+    async def test_create_workspace_success(self, workspace_service, mock_db, patch_get_role, sample_user, sample_role):
+        """Test successful workspace creation."""
+        # Arrange
+        workspace_data = _CREATE_PAYLOAD
+        patch_get_role.return_value = sample_role
+
+        # Act
+        result = await workspace_service.create_workspace(workspace_data, sample_user)
+
+        # Assert: workspace is flushed for its ID before the owner member is added
+        assert _called_methods(mock_db) == ["add", "flush", "add", "commit", "refresh"]
+        workspace, owner_member = (added.args[0] for added in mock_db.add.call_args_list)
+        assert result is workspace
+        assert result.name == workspace_data.name
+        assert result.owner_id == sample_user.id
+        assert result.status == WorkspaceStatus.ACTIVE
+        assert isinstance(owner_member, WorkspaceMember)
+        assert owner_member.user_id == sample_user.id
+        assert owner_member.role_id == sample_role.id
+        mock_db.refresh.assert_awaited_once_with(result)
+
+    async def test_create_workspace_no_admin_role(self, workspace_service, mock_db, patch_get_role, sample_user):
+        """Test workspace creation when admin role is not found."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_workspace
-        mock_db.execute.return_value = mock_result
+        workspace_data = _CREATE_MINIMAL_PAYLOAD
+        patch_get_role.return_value = None
 
         # Act
-        result = await workspace_service.get_workspace_by_id(sample_workspace.id)
+        result = await workspace_service.create_workspace(workspace_data, sample_user)
 
         # Assert
-        assert result == sample_workspace
-        mock_db.execute.assert_called_once()
+        assert _called_methods(mock_db) == ["add", "flush", "commit", "refresh"]  # Only workspace, no member
 
-    async def test_get_workspace_by_id_not_found(self, workspace_service, mock_db):
-        """Test getting workspace by ID when not found."""
+    @pytest.mark.parametrize("found", [True, False], ids=["found", "not_found"])
+    async def test_get_workspace_by_id(self, workspace_service, mock_db, sample_workspace_readonly, found):
+        """Test getting workspace by ID when found and when not found."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        expected = sample_workspace_readonly if found else None
+        mock_db.execute.return_value = _ScalarResult(expected)
 
         # Act
-        result = await workspace_service.get_workspace_by_id(uuid4())
+        result = await workspace_service.get_workspace_by_id(sample_workspace_readonly.id)
 
         # Assert
-        assert result is None
+        assert result is expected
         mock_db.execute.assert_called_once()
 
-    async def test_get_workspace_with_members(self, workspace_service, mock_db, sample_workspace):
+    async def test_get_workspace_with_members(self, workspace_service, mock_db, sample_workspace_readonly):
         """Test getting workspace with member details."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_workspace
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _ScalarResult(sample_workspace_readonly)
 
         # Act
-        result = await workspace_service.get_workspace_with_members(sample_workspace.id)
+        result = await workspace_service.get_workspace_with_members(sample_workspace_readonly.id)
 
         # Assert
-        assert result == sample_workspace
+        assert result == sample_workspace_readonly
         mock_db.execute.assert_called_once()
 
     async def test_get_user_workspaces_owned_and_member(self, workspace_service, mock_db, sample_user):
@@ -187,9 +264,7 @@ class TestWorkspaceService:
             Workspace(id=uuid4(), name="Member Workspace", owner_id=uuid4())
         ]
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = workspaces
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _ScalarsResult(workspaces)
 
         # Act
         result = await workspace_service.get_user_workspaces(
@@ -207,9 +282,7 @@ class TestWorkspaceService:
         # Arrange
         workspaces = [Workspace(id=uuid4(), name="Owned Workspace", owner_id=sample_user.id)]
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = workspaces
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _ScalarsResult(workspaces)
 
         # Act
         result = await workspace_service.get_user_workspaces(
@@ -227,9 +300,7 @@ class TestWorkspaceService:
         # Arrange
         workspaces = [Workspace(id=uuid4(), name="Active Workspace", status=WorkspaceStatus.ACTIVE)]
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = workspaces
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _ScalarsResult(workspaces)
 
         # Act
         result = await workspace_service.get_user_workspaces(
@@ -243,254 +314,180 @@ class TestWorkspaceService:
         assert result == workspaces
         mock_db.execute.assert_called_once()
 
-    async def test_update_workspace_success(self, workspace_service, mock_db, sample_workspace):
+    async def test_update_workspace_success(self, workspace_service, mock_db, sample_workspace_mutable):
         """Test successful workspace update."""
         # Arrange
-        update_data = WorkspaceUpdate(
-            name="Updated Workspace",
-            description="Updated description",
-            is_public=True
-        )
+        update_data = _UPDATE_PAYLOAD
 
         # Act
-        result = await workspace_service.update_workspace(sample_workspace, update_data)
+        result = await workspace_service.update_workspace(sample_workspace_mutable, update_data)
 
         # Assert
-        assert sample_workspace.name == "Updated Workspace"
-        assert sample_workspace.description == "Updated description"
-        assert sample_workspace.is_public is True
-        mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once_with(sample_workspace)
+        assert sample_workspace_mutable.name == "Updated Workspace"
+        assert sample_workspace_mutable.description == "Updated description"
+        assert sample_workspace_mutable.is_public is True
+        assert mock_db.method_calls == [call.commit(), call.refresh(sample_workspace_mutable)]
 
-    async def test_update_workspace_partial_update(self, workspace_service, mock_db, sample_workspace):
+    async def test_update_workspace_partial_update(self, workspace_service, mock_db, sample_workspace_mutable):
         """Test partial workspace update."""
         # Arrange
-        original_name = sample_workspace.name
-        update_data = WorkspaceUpdate(description="New description only")
+        original_name = sample_workspace_mutable.name
+        update_data = _PARTIAL_UPDATE_PAYLOAD
 
         # Act
-        result = await workspace_service.update_workspace(sample_workspace, update_data)
+        result = await workspace_service.update_workspace(sample_workspace_mutable, update_data)
 
         # Assert
-        assert sample_workspace.name == original_name  # Unchanged
-        assert sample_workspace.description == "New description only"
+        assert sample_workspace_mutable.name == original_name  # Unchanged
+        assert sample_workspace_mutable.description == "New description only"
         mock_db.commit.assert_called_once()
 
-    async def test_delete_workspace(self, workspace_service, mock_db, sample_workspace):
+    async def test_delete_workspace(self, workspace_service, mock_db, sample_workspace_mutable):
         """Test workspace deletion (archiving)."""
         # Act
-        await workspace_service.delete_workspace(sample_workspace)
+        await workspace_service.delete_workspace(sample_workspace_mutable)
 
         # Assert
-        assert sample_workspace.status == WorkspaceStatus.ARCHIVED
+        assert sample_workspace_mutable.status == WorkspaceStatus.ARCHIVED
         mock_db.commit.assert_called_once()
 
-    async def test_add_member_success(self, workspace_service, mock_db, sample_workspace, sample_user, sample_role):
+    async def test_add_member_success(self, workspace_service, mock_db, sample_workspace_readonly, sample_user, sample_role):
         """Test successful member addition."""
         # Arrange
         inviter = User(id=uuid4(), username="inviter", email="inviter@example.com")
 
         # Act
-        result = await workspace_service.add_member(sample_workspace, sample_user, sample_role, inviter)
+        result = await workspace_service.add_member(sample_workspace_readonly, sample_user, sample_role, inviter)
 
         # Assert
-        mock_db.add.assert_called_once()
-        mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once()
+        assert _called_methods(mock_db) == ["add", "commit", "refresh"]
 
-    async def test_add_member_without_inviter(self, workspace_service, mock_db, sample_workspace, sample_user, sample_role):
+    async def test_add_member_without_inviter(
+        self, workspace_service, mock_db, sample_workspace_readonly, sample_user, sample_role
+    ):
         """Test member addition without inviter."""
         # Act
-        result = await workspace_service.add_member(sample_workspace, sample_user, sample_role)
+        result = await workspace_service.add_member(sample_workspace_readonly, sample_user, sample_role)
 
         # Assert
-        mock_db.add.assert_called_once()
-        mock_db.commit.assert_called_once()
+        assert _called_methods(mock_db) == ["add", "commit", "refresh"]
 
-    async def test_remove_member(self, workspace_service, mock_db, sample_member):
+    async def test_remove_member(self, workspace_service, mock_db, sample_member_readonly):
         """Test member removal."""
         # Act
-        await workspace_service.remove_member(sample_member)
+        await workspace_service.remove_member(sample_member_readonly)
 
         # Assert
-        mock_db.delete.assert_called_once_with(sample_member)
-        mock_db.commit.assert_called_once()
+        assert mock_db.method_calls == [call.delete(sample_member_readonly), call.commit()]
 
-    async def test_update_member_role(self, workspace_service, mock_db, sample_member, sample_role):
+    async def test_update_member_role(self, workspace_service, mock_db, sample_member_mutable):
         """Test member role update."""
         # Arrange
         new_role = WorkspaceRole(
             id=uuid4(),
-            name=WorkspaceRoleEnum.MEMBER,
-            description="Member role"
+            name=WorkspaceRoleEnum.EDITOR,
+            description="Editor role"
         )
-        sample_member.role = sample_role  # Set current role
+        # A role local to this test: assigning it appends the member to
+        # role.members through the backref, so the session sample_role can't be used
+        current_role = WorkspaceRole(id=sample_member_mutable.role_id, name=WorkspaceRoleEnum.ADMIN)
+        sample_member_mutable.role = current_role
 
         # Act
-        result = await workspace_service.update_member_role(sample_member, new_role)
+        result = await workspace_service.update_member_role(sample_member_mutable, new_role)
 
         # Assert
-        assert sample_member.role_id == new_role.id
-        mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once_with(sample_member)
+        assert sample_member_mutable.role_id == new_role.id
+        assert mock_db.method_calls == [call.commit(), call.refresh(sample_member_mutable)]
 
-    async def test_get_role_by_name_found(self, workspace_service, mock_db, sample_role):
-        """Test getting role by name when found."""
+    @pytest.mark.parametrize("found", [True, False], ids=["found", "not_found"])
+    async def test_get_role_by_name(self, workspace_service, mock_db, sample_role, found):
+        """Test getting role by name when found and when not found."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_role
-        mock_db.execute.return_value = mock_result
+        expected = sample_role if found else None
+        mock_db.execute.return_value = _ScalarResult(expected)
 
         # Act
         result = await workspace_service.get_role_by_name(WorkspaceRoleEnum.ADMIN)
 
         # Assert
-        assert result == sample_role
+        assert result is expected
         mock_db.execute.assert_called_once()
 
-    async def test_get_role_by_name_not_found(self, workspace_service, mock_db):
-        """Test getting role by name when not found."""
+    @pytest.mark.parametrize("found", [True, False], ids=["found", "not_found"])
+    async def test_get_workspace_member(self, workspace_service, mock_db, sample_member_readonly, found):
+        """Test getting workspace member when found and when not found."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        # Act
-        result = await workspace_service.get_role_by_name(WorkspaceRoleEnum.ADMIN)
-
-        # Assert
-        assert result is None
-        mock_db.execute.assert_called_once()
-
-    async def test_get_workspace_member_found(self, workspace_service, mock_db, sample_member):
-        """Test getting workspace member when found."""
-        # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_member
-        mock_db.execute.return_value = mock_result
+        expected = sample_member_readonly if found else None
+        mock_db.execute.return_value = _ScalarResult(expected)
 
         # Act
         result = await workspace_service.get_workspace_member(
-            sample_member.workspace_id,
-            sample_member.user_id
+            sample_member_readonly.workspace_id,
+            sample_member_readonly.user_id
         )
 
         # Assert
-        assert result == sample_member
+        assert result is expected
         mock_db.execute.assert_called_once()
 
-    async def test_get_workspace_member_not_found(self, workspace_service, mock_db):
-        """Test getting workspace member when not found."""
+    @pytest.mark.parametrize("scalar,expected", [(5, 5), (None, 0)], ids=["count", "none_result"])
+    async def test_count_workspace_members(self, workspace_service, mock_db, sample_workspace_readonly, scalar, expected):
+        """Test counting workspace members, treating a None result as zero."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _ScalarResult(scalar)
 
         # Act
-        result = await workspace_service.get_workspace_member(uuid4(), uuid4())
+        result = await workspace_service.count_workspace_members(sample_workspace_readonly.id)
 
         # Assert
-        assert result is None
+        assert result == expected
         mock_db.execute.assert_called_once()
 
-    async def test_count_workspace_members(self, workspace_service, mock_db, sample_workspace):
-        """Test counting workspace members."""
-        # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar.return_value = 5
-        mock_db.execute.return_value = mock_result
-
-        # Act
-        result = await workspace_service.count_workspace_members(sample_workspace.id)
-
-        # Assert
-        assert result == 5
-        mock_db.execute.assert_called_once()
-
-    async def test_count_workspace_members_none_result(self, workspace_service, mock_db, sample_workspace):
-        """Test counting workspace members when result is None."""
-        # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        # Act
-        result = await workspace_service.count_workspace_members(sample_workspace.id)
-
-        # Assert
-        assert result == 0
-        mock_db.execute.assert_called_once()
-
-    async def test_is_workspace_owner_true(self, workspace_service, sample_workspace, sample_user):
+    async def test_is_workspace_owner_true(self, workspace_service, sample_workspace_mutable, sample_user):
         """Test workspace owner check when user is owner."""
         # Arrange
-        sample_workspace.owner_id = sample_user.id
+        sample_workspace_mutable.owner_id = sample_user.id
 
         # Act
-        result = await workspace_service.is_workspace_owner(sample_workspace, sample_user)
+        result = await workspace_service.is_workspace_owner(sample_workspace_mutable, sample_user)
 
         # Assert
         assert result is True
 
-    async def test_is_workspace_owner_false(self, workspace_service, sample_workspace, sample_user):
+    async def test_is_workspace_owner_false(self, workspace_service, sample_workspace_mutable, sample_user):
         """Test workspace owner check when user is not owner."""
         # Arrange
-        sample_workspace.owner_id = uuid4()  # Different user
+        sample_workspace_mutable.owner_id = uuid4()  # Different user
 
         # Act
-        result = await workspace_service.is_workspace_owner(sample_workspace, sample_user)
+        result = await workspace_service.is_workspace_owner(sample_workspace_mutable, sample_user)
 
         # Assert
         assert result is False
 
-    async def test_can_add_members_unlimited(self, workspace_service, sample_workspace):
-        """Test can add members when no limit is set."""
+    @pytest.mark.parametrize(
+        "max_members,current,expected",
+        [(None, 0, True), (10, 5, True), (10, 10, False), (10, 15, False)],
+        ids=["unlimited", "under_limit", "at_limit", "over_limit"],
+    )
+    @patch.object(WorkspaceService, 'count_workspace_members', new_callable=AsyncMock)
+    async def test_can_add_members(
+        self, mock_count, workspace_service, sample_workspace_mutable, max_members, current, expected
+    ):
+        """Test can add members against the workspace member limit."""
         # Arrange
-        sample_workspace.max_members = None
+        sample_workspace_mutable.max_members = max_members
+        mock_count.return_value = current
 
         # Act
-        result = await workspace_service.can_add_members(sample_workspace)
-
-        # Assert
-        assert result is True
-
-    async def test_can_add_members_under_limit(self, workspace_service, mock_db, sample_workspace):
-        """Test can add members when under limit."""
-        # Arrange
-        sample_workspace.max_members = 10
-
-        with patch.object(workspace_service, 'count_workspace_members', return_value=5):
-            # Act
-            result = await workspace_service.can_add_members(sample_workspace)
-
-        # Assert
-        assert result is True
-
-    async def test_can_add_members_at_limit(self, workspace_service, mock_db, sample_workspace):
-        """Test can add members when at limit."""
-        # Arrange
-        sample_workspace.max_members = 10
-
-        with patch.object(workspace_service, 'count_workspace_members', return_value=10):
-            # Act
-            result = await workspace_service.can_add_members(sample_workspace)
+        result = await workspace_service.can_add_members(sample_workspace_mutable)
 
         # Assert
-        assert result is False
-
-    async def test_can_add_members_over_limit(self, workspace_service, mock_db, sample_workspace):
-        """Test can add members when over limit."""
-        # Arrange
-        sample_workspace.max_members = 10
-
-        with patch.object(workspace_service, 'count_workspace_members', return_value=15):
-            # Act
-            result = await workspace_service.can_add_members(sample_workspace)
-
-        # Assert
-        assert result is False
+        assert result is expected
 
 
+@pytest.mark.serial
 class TestWorkspaceServiceIntegration:
     """Integration tests for WorkspaceService with more complex scenarios."""
 
@@ -499,13 +496,15 @@ class TestWorkspaceServiceIntegration:
         """WorkspaceService instance for integration tests."""
         return WorkspaceService(db=mock_db)
 
-    async def test_create_workspace_with_member_flow(self, workspace_service, mock_db):
+    @pytest.mark.skip(reason="integration placeholder - not implemented yet")
+    def test_create_workspace_with_member_flow(self, workspace_service, mock_db):
         """Test complete workspace creation with member addition flow."""
         # This would be an integration test that tests the full flow
         # of creating a workspace and adding the owner as admin
         pass
 
-    async def test_workspace_member_management_flow(self, workspace_service, mock_db):
+    @pytest.mark.skip(reason="integration placeholder - not implemented yet")
+    def test_workspace_member_management_flow(self, workspace_service, mock_db):
         """Test complete member management flow."""
         # This would test adding, updating roles, and removing members
         pass
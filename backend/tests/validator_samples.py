@@ -0,0 +1,22 @@
+"""
+Validator sample inputs shared by the pattern tests and the per-validator test modules.
+"""
+
+# Username length boundaries
+USERNAME_MAX = "a" * 50
+USERNAME_TOO_LONG = "a" * 51
+
+# Filenames rejected for a path separator or reserved character
+INVALID_FILENAME_CHARS = (
+    "file<name.txt",
+    "file>name.txt",
+    "file:name.txt",
+    "file/name.txt",
+    "file\\name.txt",
+    "file|name.txt",
+    "file?name.txt",
+    "file*name.txt",
+)
+
+# Every filename FILENAME must reject, including quotes and control characters
+INVALID_FILENAME_ALL = INVALID_FILENAME_CHARS + ('file"name.txt', "file\x00name.txt")